@@ -10,8 +10,20 @@ from pathlib import Path
 from typing import Any, Literal
 
 import yaml
-from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Matches ${VAR_NAME} references in config values
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+# Parsed YAML keyed by path: (mtime_ns, raw data before env var resolution)
+_YAML_CACHE: dict[Path, tuple[int, dict[str, Any]]] = {}
 
 
 class TrackerType(str, Enum):
@@ -21,7 +33,29 @@ class TrackerType(str, Enum):
     REDMINE = "redmine"
 
 
-class JiraConfig(BaseModel):
+_TRACKER_BY_NAME: dict[str, TrackerType] = {t.value: t for t in TrackerType}
+
+
+def _parse_tracker(value: Any) -> Any:
+    """Accept tracker names case-insensitively (e.g. "Redmine")."""
+    if isinstance(value, str):
+        tracker = _TRACKER_BY_NAME.get(value)
+        if tracker is None and not value.islower():
+            tracker = _TRACKER_BY_NAME.get(value.lower())
+        # Unknown names fall through so pydantic reports the enum error
+        return tracker if tracker is not None else value
+    return value
+
+
+class ConfigSection(BaseModel):
+    """Base for nested config sections."""
+
+    # Sections are immutable once loaded, so instances can be shared freely
+    # and are never copied or re-validated when passed into Settings
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
+
+class JiraConfig(ConfigSection):
     """Jira configuration."""
 
     url: str = "https://company.atlassian.net"
@@ -29,7 +63,7 @@ class JiraConfig(BaseModel):
     api_token: str = ""
 
 
-class RedmineConfig(BaseModel):
+class RedmineConfig(ConfigSection):
     """Redmine configuration."""
 
     url: str = "https://redmine.company.com"
@@ -39,7 +73,7 @@ class RedmineConfig(BaseModel):
     in_progress_status: str = "In Progress"
 
 
-class BitbucketConfig(BaseModel):
+class BitbucketConfig(ConfigSection):
     """Bitbucket configuration."""
 
     workspace: str = ""
@@ -47,7 +81,7 @@ class BitbucketConfig(BaseModel):
     app_password: str = ""
 
 
-class ProjectConfig(BaseModel):
+class ProjectConfig(ConfigSection):
     """Project configuration."""
 
     name: str
@@ -58,8 +92,13 @@ class ProjectConfig(BaseModel):
     # Optional: specify tracker for this project (overrides global setting)
     tracker: TrackerType | None = None
 
+    @field_validator("tracker", mode="before")
+    @classmethod
+    def _normalize_tracker(cls, value: Any) -> Any:
+        return _parse_tracker(value)
+
 
-class WorkflowConfig(BaseModel):
+class WorkflowConfig(ConfigSection):
     """Workflow configuration."""
 
     max_retries: int = 5
@@ -71,7 +110,7 @@ class WorkflowConfig(BaseModel):
     in_progress_status: str = "In Progress"
 
 
-class ClaudeConfig(BaseModel):
+class ClaudeConfig(ConfigSection):
     """Claude CLI configuration."""
 
     model: str = "sonnet"
@@ -99,9 +138,15 @@ class Settings(BaseSettings):
     log_dir: str = "logs"
     history_file: str = "history.json"
 
-    class Config:
-        env_prefix = "ORCHESTRATOR_"
-        env_nested_delimiter = "__"
+    model_config = SettingsConfigDict(
+        env_prefix="ORCHESTRATOR_",
+        env_nested_delimiter="__",
+    )
+
+    @field_validator("tracker", mode="before")
+    @classmethod
+    def _normalize_tracker(cls, value: Any) -> Any:
+        return _parse_tracker(value)
 
     def get_done_status(self) -> str:
         """Get done status based on active tracker."""
@@ -119,12 +164,10 @@ class Settings(BaseSettings):
 def _resolve_env_vars(value: Any) -> Any:
     """Resolve environment variables in string values like ${VAR_NAME}."""
     if isinstance(value, str):
-        pattern = r"\$\{([^}]+)\}"
-        matches = re.findall(pattern, value)
-        for match in matches:
-            env_value = os.getenv(match, "")
-            value = value.replace(f"${{{match}}}", env_value)
-        return value
+        # Fast path: most values have no variable references
+        if "${" not in value:
+            return value
+        return _ENV_VAR_RE.sub(lambda m: os.getenv(m.group(1), ""), value)
     elif isinstance(value, dict):
         return {k: _resolve_env_vars(v) for k, v in value.items()}
     elif isinstance(value, list):
@@ -132,27 +175,48 @@ def _resolve_env_vars(value: Any) -> Any:
     return value
 
 
+def _find_default_config() -> Path | None:
+    """Find the first existing config file in the default locations."""
+    # Directories to search in priority order, each listed once
+    search_dirs = [
+        Path("config"),
+        Path("."),
+        Path.home() / ".task-orchestrator",
+    ]
+    for directory in search_dirs:
+        try:
+            with os.scandir(directory) as entries:
+                if any(e.name == "config.yaml" and e.is_file() for e in entries):
+                    return directory / "config.yaml"
+        except OSError:
+            continue
+    return None
+
+
 def load_config_file(config_path: Path | None = None) -> dict[str, Any]:
     """Load configuration from YAML file."""
     if config_path is None:
-        # Try default locations
-        locations = [
-            Path("config/config.yaml"),
-            Path("config.yaml"),
-            Path.home() / ".task-orchestrator" / "config.yaml",
-        ]
-        for loc in locations:
-            if loc.exists():
-                config_path = loc
-                break
-
-    if config_path is None or not config_path.exists():
+        config_path = _find_default_config()
+
+    if config_path is None:
         return {}
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config_data = yaml.safe_load(f) or {}
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        return {}
 
-    # Resolve environment variables
+    # Only re-parse when the file changed since the last load
+    cached = _YAML_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime_ns:
+        config_data = cached[1]
+    else:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config_data = yaml.load(f, Loader=_YamlLoader) or {}
+        _YAML_CACHE[config_path] = (mtime_ns, config_data)
+
+    # Resolve environment variables (builds fresh containers, so the cached
+    # data is never handed out or mutated)
     return _resolve_env_vars(config_data)
 
 
@@ -162,32 +226,18 @@ def get_settings(config_path: str | None = None) -> Settings:
     path = Path(config_path) if config_path else None
     config_data = load_config_file(path)
 
-    # Convert tracker string to enum
-    if "tracker" in config_data:
-        config_data["tracker"] = TrackerType(config_data["tracker"].lower())
-
-    # Convert nested dicts to Pydantic models
-    if "jira" in config_data:
-        config_data["jira"] = JiraConfig(**config_data["jira"])
-    if "redmine" in config_data:
-        config_data["redmine"] = RedmineConfig(**config_data["redmine"])
-    if "bitbucket" in config_data:
-        config_data["bitbucket"] = BitbucketConfig(**config_data["bitbucket"])
-    if "projects" in config_data:
-        projects = []
-        for p in config_data["projects"]:
-            if "tracker" in p and isinstance(p["tracker"], str):
-                p["tracker"] = TrackerType(p["tracker"].lower())
-            projects.append(ProjectConfig(**p))
-        config_data["projects"] = projects
-    if "workflow" in config_data:
-        config_data["workflow"] = WorkflowConfig(**config_data["workflow"])
-    if "claude" in config_data:
-        config_data["claude"] = ClaudeConfig(**config_data["claude"])
-
+    # Pydantic builds the nested section models from the raw dicts
     return Settings(**config_data)
 
 
-def clear_settings_cache() -> None:
-    """Clear the settings cache."""
+def clear_settings_cache(clear_file_cache: bool = False) -> None:
+    """
+    Clear the settings cache.
+
+    Args:
+        clear_file_cache: Also drop parsed YAML files, forcing a re-parse
+            even if the config file has not changed
+    """
     get_settings.cache_clear()
+    if clear_file_cache:
+        _YAML_CACHE.clear()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import logging
 from collections import deque
@@ -17,8 +18,13 @@ from src.core.task_runner import TaskRunner, TaskResult
 
 logger = logging.getLogger(__name__)
 
+# Number of history entries to retain
+HISTORY_LIMIT = 100
+# Compact the append-only history file once it grows past this many entries
+HISTORY_COMPACT_AT = HISTORY_LIMIT * 10
 
-@dataclass
+
+@dataclass(slots=True)
 class QueuedTask:
     """Task in the queue."""
 
@@ -26,6 +32,8 @@ class QueuedTask:
     priority: int = 0
     added_at: datetime = field(default_factory=datetime.now)
     state_machine: TaskStateMachine | None = None
+    # Set when removed from the queue; the heap entry is skipped lazily
+    cancelled: bool = False
 
     def __lt__(self, other: "QueuedTask") -> bool:
         # Higher priority first, then earlier added
@@ -52,7 +60,8 @@ class Orchestrator:
         on_log: Callable[[str, str], None] | None = None,
     ):
         self._settings = settings
-        self._queue: deque[QueuedTask] = deque()
+        self._queue: list[QueuedTask] = []  # Heap ordered by QueuedTask.__lt__
+        self._queue_index: dict[str, QueuedTask] = {}  # Live (non-removed) entries
         self._active_tasks: dict[str, asyncio.Task] = {}
         self._completed: list[TaskResult] = []
         self._paused = False
@@ -60,8 +69,17 @@ class Orchestrator:
         self._on_task_update = on_task_update
         self._on_log = on_log
 
-        # History file
+        # Status snapshots, rebuilt only after the queue/active set changes
+        self._status_gen = 0
+        self._queue_status_cache: tuple[int, list[dict]] | None = None
+        self._active_status_cache: tuple[int, list[dict]] | None = None
+
+        # Wakes the scheduler loop when there may be work to do
+        self._wakeup = asyncio.Event()
+
+        # History file (JSON lines, append-only with periodic compaction)
         self._history_path = Path(settings.history_file)
+        self._history_count: int | None = None  # Lines on disk, counted lazily
 
         # Create task runner
         self._runner = TaskRunner(
@@ -70,6 +88,11 @@ class Orchestrator:
             on_log=on_log,
         )
 
+    def _mark_changed(self) -> None:
+        """Invalidate status snapshots and wake the scheduler loop."""
+        self._status_gen += 1
+        self._wakeup.set()
+
     def _handle_state_change(
         self,
         jira_key: str,
@@ -83,7 +106,7 @@ class Orchestrator:
     @property
     def queue_size(self) -> int:
         """Number of tasks in queue."""
-        return len(self._queue)
+        return len(self._queue_index)
 
     @property
     def active_count(self) -> int:
@@ -112,7 +135,7 @@ class Orchestrator:
             True if added, False if already in queue
         """
         # Check if already queued or active
-        if any(t.jira_key == jira_key for t in self._queue):
+        if jira_key in self._queue_index:
             logger.warning(f"Task {jira_key} already in queue")
             return False
 
@@ -126,17 +149,9 @@ class Orchestrator:
             state_machine=TaskStateMachine(jira_key, self._settings.workflow.max_retries),
         )
 
-        # Insert maintaining priority order
-        inserted = False
-        for i, queued in enumerate(self._queue):
-            if task < queued:
-                continue
-            self._queue.insert(i, task)
-            inserted = True
-            break
-
-        if not inserted:
-            self._queue.append(task)
+        heapq.heappush(self._queue, task)
+        self._queue_index[jira_key] = task
+        self._mark_changed()
 
         logger.info(f"Task {jira_key} added to queue (priority: {priority})")
 
@@ -155,12 +170,19 @@ class Orchestrator:
         Returns:
             True if removed
         """
-        for i, task in enumerate(self._queue):
-            if task.jira_key == jira_key:
-                del self._queue[i]
-                logger.info(f"Task {jira_key} removed from queue")
-                return True
-        return False
+        task = self._queue_index.pop(jira_key, None)
+        if task is None:
+            return False
+
+        task.cancelled = True
+        # Every heap entry is either live (indexed) or a tombstone. While
+        # paused or busy nothing pops them, so rebuild once they dominate.
+        if len(self._queue) > 2 * len(self._queue_index):
+            self._queue = list(self._queue_index.values())
+            heapq.heapify(self._queue)
+        self._mark_changed()
+        logger.info(f"Task {jira_key} removed from queue")
+        return True
 
     def cancel_task(self, jira_key: str) -> bool:
         """
@@ -186,6 +208,7 @@ class Orchestrator:
     def resume(self) -> None:
         """Resume processing tasks."""
         self._paused = False
+        self._wakeup.set()
         logger.info("Orchestrator resumed")
 
     async def start(self, max_concurrent: int = 1) -> None:
@@ -200,18 +223,18 @@ class Orchestrator:
 
         try:
             while self._running:
-                # Clean up completed tasks
-                self._cleanup_completed()
+                self._wakeup.clear()
 
-                # Check if we can start new tasks
-                if (
+                # Start as many tasks as we have free slots for
+                while (
                     not self._paused
-                    and self._queue
+                    and self._queue_index
                     and len(self._active_tasks) < max_concurrent
                 ):
                     await self._start_next_task()
 
-                await asyncio.sleep(0.5)
+                # Sleep until the queue, active set or pause state changes
+                await self._wakeup.wait()
 
         except asyncio.CancelledError:
             logger.info("Orchestrator cancelled")
@@ -222,16 +245,23 @@ class Orchestrator:
     async def stop(self) -> None:
         """Stop the orchestrator."""
         self._running = False
+        self._wakeup.set()
         await self._cancel_all_tasks()
+        self._runner.close()
         logger.info("Orchestrator stopped")
 
     async def _start_next_task(self) -> None:
         """Start the next task from queue."""
+        # Discard entries removed from the queue since they were pushed
+        while self._queue and self._queue[0].cancelled:
+            heapq.heappop(self._queue)
+
         if not self._queue:
             return
 
-        queued = self._queue.popleft()
+        queued = heapq.heappop(self._queue)
         jira_key = queued.jira_key
+        del self._queue_index[jira_key]
 
         logger.info(f"Starting task: {jira_key}")
 
@@ -240,20 +270,17 @@ class Orchestrator:
             self._completed.append(result)
             self._save_history(result)
 
-            # Remove from active
-            if jira_key in self._active_tasks:
-                del self._active_tasks[jira_key]
-
         task = asyncio.create_task(run_and_record())
+        # Also covers cancellation/errors, where run_and_record exits early
+        task.add_done_callback(lambda t: self._on_task_done(jira_key, t))
         self._active_tasks[jira_key] = task
+        self._mark_changed()
 
-    def _cleanup_completed(self) -> None:
-        """Clean up finished tasks from active dict."""
-        completed = [
-            key for key, task in self._active_tasks.items() if task.done()
-        ]
-        for key in completed:
-            del self._active_tasks[key]
+    def _on_task_done(self, jira_key: str, task: asyncio.Task) -> None:
+        """Remove a finished task from the active dict."""
+        if self._active_tasks.get(jira_key) is task:
+            del self._active_tasks[jira_key]
+        self._mark_changed()
 
     async def _cancel_all_tasks(self) -> None:
         """Cancel all active tasks."""
@@ -264,63 +291,149 @@ class Orchestrator:
             except asyncio.CancelledError:
                 pass
         self._active_tasks.clear()
+        self._mark_changed()
 
     def _save_history(self, result: TaskResult) -> None:
-        """Save task result to history file."""
+        """Append task result to history file."""
+        entry = {
+            "jira_key": result.jira_key,
+            "success": result.success,
+            "pr_url": result.pr_url,
+            "error_message": result.error_message,
+            "attempts": result.attempts,
+            "completed_at": datetime.now().isoformat(),
+        }
+
         try:
-            history = []
-            if self._history_path.exists():
-                with open(self._history_path, "r") as f:
-                    history = json.load(f)
-
-            history.append({
-                "jira_key": result.jira_key,
-                "success": result.success,
-                "pr_url": result.pr_url,
-                "error_message": result.error_message,
-                "attempts": result.attempts,
-                "completed_at": datetime.now().isoformat(),
-            })
-
-            # Keep last 100 entries
-            history = history[-100:]
-
-            with open(self._history_path, "w") as f:
-                json.dump(history, f, indent=2)
+            if self._history_count is None:
+                self._history_count = self._prepare_history_file()
+
+            with open(self._history_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+            self._history_count += 1
+
+            if self._history_count > HISTORY_COMPACT_AT:
+                self._compact_history()
 
         except Exception as e:
             logger.error(f"Failed to save history: {e}")
 
+    def _prepare_history_file(self) -> int:
+        """
+        Make the history file ready for appending JSON lines.
+
+        Converts a legacy JSON array file to JSON lines (or moves it aside
+        if it can't be read) and makes sure the file ends with a newline.
+
+        Returns:
+            Number of lines in the file
+        """
+        path = self._history_path
+        if not path.exists():
+            return 0
+
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.strip():
+            return 0
+
+        if data.lstrip()[:1] == b"[":
+            try:
+                entries = json.loads(data)
+            except ValueError:
+                backup = path.with_name(path.name + ".bak")
+                logger.warning(f"Unreadable history file moved to {backup}")
+                path.replace(backup)
+                return 0
+
+            lines = [json.dumps(entry) + "\n" for entry in entries[-HISTORY_LIMIT:]]
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+            tmp_path.replace(path)
+            logger.info(f"Converted history file {path} to JSON lines")
+            return len(lines)
+
+        # A partial last line would otherwise merge with the next entry
+        if not data.endswith(b"\n"):
+            with open(path, "ab") as f:
+                f.write(b"\n")
+            data += b"\n"
+        return data.count(b"\n")
+
+    def _compact_history(self) -> None:
+        """Rewrite history file keeping only the last HISTORY_LIMIT entries."""
+        with open(self._history_path, "r", encoding="utf-8") as f:
+            lines = deque(f, maxlen=HISTORY_LIMIT)
+
+        tmp_path = self._history_path.with_name(self._history_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        tmp_path.replace(self._history_path)
+        self._history_count = len(lines)
+
     def get_history(self, limit: int = 20) -> list[dict]:
         """Get recent task history."""
         if not self._history_path.exists():
             return []
 
         try:
-            with open(self._history_path, "r") as f:
-                history = json.load(f)
-            return history[-limit:]
-        except Exception:
+            with open(self._history_path, "r", encoding="utf-8") as f:
+                first = f.read(64).lstrip()[:1]
+                f.seek(0)
+                # Legacy format: a single JSON array
+                if first == "[":
+                    entries = json.load(f)
+                    return entries[-limit:] if isinstance(entries, list) else []
+                # Keep only the last `limit` raw lines; decode just those
+                tail = deque((line for line in f if line.strip()), maxlen=limit)
+        except (OSError, ValueError):
             return []
 
+        history = []
+        for line in tail:
+            try:
+                history.append(json.loads(line))
+            except ValueError:
+                continue  # Skip a damaged line rather than the whole history
+        return history
+
     def get_queue_status(self) -> list[dict]:
-        """Get current queue status."""
-        return [
+        """
+        Get current queue status.
+
+        The returned list is a shared snapshot; callers must not mutate it.
+        """
+        if self._queue_status_cache and self._queue_status_cache[0] == self._status_gen:
+            return self._queue_status_cache[1]
+
+        status = [
             {
                 "jira_key": t.jira_key,
                 "priority": t.priority,
                 "added_at": t.added_at.isoformat(),
                 "state": t.state_machine.state.name if t.state_machine else "PENDING",
             }
-            for t in self._queue
+            for t in sorted(self._queue_index.values())
         ]
+        self._queue_status_cache = (self._status_gen, status)
+        return status
 
     def get_active_status(self) -> list[dict]:
-        """Get active tasks status."""
-        return [
+        """
+        Get active tasks status.
+
+        The returned list is a shared snapshot; callers must not mutate it.
+        """
+        if self._active_status_cache and self._active_status_cache[0] == self._status_gen:
+            return self._active_status_cache[1]
+
+        status = [
             {"jira_key": key, "running": not task.done()}
             for key, task in self._active_tasks.items()
         ]
+        self._active_status_cache = (self._status_gen, status)
+        return status
 
     async def run_single(self, jira_key: str) -> TaskResult:
         """
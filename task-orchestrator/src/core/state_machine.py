@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Callable
 
 
@@ -44,29 +45,55 @@ class TaskState(Enum):
         )
 
 
+_NO_TRANSITIONS: frozenset[TaskState] = frozenset()
+
 # Valid state transitions
-VALID_TRANSITIONS: dict[TaskState, set[TaskState]] = {
-    TaskState.PENDING: {TaskState.FETCHING, TaskState.CANCELLED},
-    TaskState.FETCHING: {TaskState.IMPLEMENTING, TaskState.FAILED, TaskState.CANCELLED},
-    TaskState.IMPLEMENTING: {TaskState.TESTING, TaskState.FAILED, TaskState.CANCELLED},
-    TaskState.TESTING: {
-        TaskState.CREATING_PR,  # Test passed
-        TaskState.FIXING,  # Test failed, retry
-        TaskState.MANUAL_REVIEW,  # Max retries exceeded
-        TaskState.FAILED,
-        TaskState.CANCELLED,
-    },
-    TaskState.FIXING: {TaskState.TESTING, TaskState.FAILED, TaskState.CANCELLED},
-    TaskState.CREATING_PR: {TaskState.UPDATING_JIRA, TaskState.FAILED, TaskState.CANCELLED},
-    TaskState.UPDATING_JIRA: {TaskState.COMPLETED, TaskState.FAILED},
-    TaskState.COMPLETED: set(),
-    TaskState.FAILED: set(),
-    TaskState.MANUAL_REVIEW: set(),
-    TaskState.CANCELLED: set(),
+VALID_TRANSITIONS: dict[TaskState, frozenset[TaskState]] = {
+    TaskState.PENDING: frozenset({TaskState.FETCHING, TaskState.CANCELLED}),
+    TaskState.FETCHING: frozenset({TaskState.IMPLEMENTING, TaskState.FAILED, TaskState.CANCELLED}),
+    TaskState.IMPLEMENTING: frozenset({TaskState.TESTING, TaskState.FAILED, TaskState.CANCELLED}),
+    TaskState.TESTING: frozenset(
+        {
+            TaskState.CREATING_PR,  # Test passed
+            TaskState.FIXING,  # Test failed, retry
+            TaskState.MANUAL_REVIEW,  # Max retries exceeded
+            TaskState.FAILED,
+            TaskState.CANCELLED,
+        }
+    ),
+    TaskState.FIXING: frozenset({TaskState.TESTING, TaskState.FAILED, TaskState.CANCELLED}),
+    TaskState.CREATING_PR: frozenset(
+        {TaskState.UPDATING_JIRA, TaskState.FAILED, TaskState.CANCELLED}
+    ),
+    TaskState.UPDATING_JIRA: frozenset({TaskState.COMPLETED, TaskState.FAILED}),
+    TaskState.COMPLETED: _NO_TRANSITIONS,
+    TaskState.FAILED: _NO_TRANSITIONS,
+    TaskState.MANUAL_REVIEW: _NO_TRANSITIONS,
+    TaskState.CANCELLED: _NO_TRANSITIONS,
+}
+
+
+@lru_cache(maxsize=256)
+def _is_valid_transition(from_state: TaskState, to_state: TaskState) -> bool:
+    """Check a (from, to) pair against VALID_TRANSITIONS."""
+    return to_state in VALID_TRANSITIONS.get(from_state, _NO_TRANSITIONS)
+
+
+# Display strings for states that don't depend on the attempt counter
+_STATIC_STATE_DISPLAY: dict[TaskState, str] = {
+    TaskState.PENDING: "Pending",
+    TaskState.FETCHING: "Fetching from Jira...",
+    TaskState.IMPLEMENTING: "Claude implementing...",
+    TaskState.CREATING_PR: "Creating PR...",
+    TaskState.UPDATING_JIRA: "Updating Jira...",
+    TaskState.COMPLETED: "Completed",
+    TaskState.FAILED: "Failed",
+    TaskState.MANUAL_REVIEW: "Needs manual review",
+    TaskState.CANCELLED: "Cancelled",
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class StateTransition:
     """Record of a state transition."""
 
@@ -76,7 +103,7 @@ class StateTransition:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskContext:
     """Context data for a task throughout its lifecycle."""
 
@@ -130,7 +157,7 @@ class TaskStateMachine:
 
     def can_transition_to(self, new_state: TaskState) -> bool:
         """Check if transition to new state is valid."""
-        return new_state in VALID_TRANSITIONS.get(self._state, set())
+        return _is_valid_transition(self._state, new_state)
 
     def transition_to(self, new_state: TaskState, message: str = "") -> bool:
         """
@@ -142,10 +169,11 @@ class TaskStateMachine:
             return False
 
         old_state = self._state
+        now = datetime.now()
         transition = StateTransition(
             from_state=old_state,
             to_state=new_state,
-            timestamp=datetime.now(),
+            timestamp=now,
             message=message,
         )
         self._context.transitions.append(transition)
@@ -153,9 +181,9 @@ class TaskStateMachine:
 
         # Track timestamps
         if new_state == TaskState.FETCHING and self._context.started_at is None:
-            self._context.started_at = datetime.now()
+            self._context.started_at = now
         elif new_state.is_terminal():
-            self._context.completed_at = datetime.now()
+            self._context.completed_at = now
 
         # Callback
         if self._on_transition:
@@ -195,20 +223,11 @@ class TaskStateMachine:
 
     def get_status_display(self) -> str:
         """Get human-readable status string."""
-        state_display = {
-            TaskState.PENDING: "Pending",
-            TaskState.FETCHING: "Fetching from Jira...",
-            TaskState.IMPLEMENTING: "Claude implementing...",
-            TaskState.TESTING: f"Testing (attempt {self._context.attempt + 1}/{self._context.max_retries})",
-            TaskState.FIXING: f"Fixing issues (attempt {self._context.attempt}/{self._context.max_retries})",
-            TaskState.CREATING_PR: "Creating PR...",
-            TaskState.UPDATING_JIRA: "Updating Jira...",
-            TaskState.COMPLETED: "Completed",
-            TaskState.FAILED: "Failed",
-            TaskState.MANUAL_REVIEW: "Needs manual review",
-            TaskState.CANCELLED: "Cancelled",
-        }
-        return state_display.get(self._state, str(self._state))
+        if self._state == TaskState.TESTING:
+            return f"Testing (attempt {self._context.attempt + 1}/{self._context.max_retries})"
+        if self._state == TaskState.FIXING:
+            return f"Fixing issues (attempt {self._context.attempt}/{self._context.max_retries})"
+        return _STATIC_STATE_DISPLAY.get(self._state, str(self._state))
 
     def to_dict(self) -> dict:
         """Serialize to dictionary."""
@@ -221,6 +240,10 @@ class TaskStateMachine:
             "attempt": self._context.attempt,
             "max_retries": self._context.max_retries,
             "error_message": self._context.error_message,
-            "started_at": self._context.started_at.isoformat() if self._context.started_at else None,
-            "completed_at": self._context.completed_at.isoformat() if self._context.completed_at else None,
+            "started_at": (
+                self._context.started_at.isoformat() if self._context.started_at else None
+            ),
+            "completed_at": (
+                self._context.completed_at.isoformat() if self._context.completed_at else None
+            ),
         }
@@ -20,9 +20,14 @@ from src.integrations import (
     create_tracker_client,
 )
 from src.core.state_machine import TaskState, TaskStateMachine
+from src.utils.concurrency import gather_limited
 
 logger = logging.getLogger(__name__)
 
+# Branch name sanitization
+_BRANCH_STRIP_RE = re.compile(r"[^a-zA-Z0-9\s-]")
+_BRANCH_SPACE_RE = re.compile(r"\s+")
+
 
 @dataclass
 class TaskResult:
@@ -54,6 +59,17 @@ class TaskRunner:
         self._on_state_change = on_state_change
         self._on_log = on_log
 
+        # Tracker display name for log messages
+        self._tracker_name = settings.tracker.value.capitalize()
+
+        # Lowercased project names for matching, in configured order
+        self._project_names = [(p, p.name.lower()) for p in settings.projects]
+
+    def close(self) -> None:
+        """Release pooled client connections."""
+        self._tracker.close()
+        self._bitbucket.close()
+
     def _log(self, task_key: str, message: str) -> None:
         """Log message and notify callback."""
         logger.info(f"[{task_key}] {message}")
@@ -76,40 +92,33 @@ class TaskRunner:
 
         Uses labels, components, or project key to match.
         """
-        for project in self._settings.projects:
-            # Match by label
-            if project.name.lower() in [l.lower() for l in issue.labels]:
-                return project
-
-            # Match by component
-            if project.name.lower() in [c.lower() for c in issue.components]:
+        # A single configured project is always the match
+        projects = self._settings.projects
+        if len(projects) == 1:
+            return projects[0]
+
+        # Every lowercased label, component, and project key/name of the issue;
+        # any of them naming a project is a match
+        candidates = {l.lower() for l in issue.labels}
+        candidates.update(c.lower() for c in issue.components)
+        candidates.add(issue.project_key.lower())
+        candidates.add(issue.project_name.lower())
+
+        for project, name in self._project_names:
+            if name in candidates:
                 return project
 
-            # Match by project key/name
-            if project.name.lower() == issue.project_key.lower():
-                return project
-            if project.name.lower() == issue.project_name.lower():
-                return project
-
-        # Return first project as default if only one configured
-        if len(self._settings.projects) == 1:
-            return self._settings.projects[0]
-
         return None
 
     def _generate_branch_name(self, issue_key: str, summary: str) -> str:
         """Generate branch name from issue."""
         # Sanitize summary for branch name
-        safe_summary = re.sub(r"[^a-zA-Z0-9\s-]", "", summary)
-        safe_summary = re.sub(r"\s+", "-", safe_summary.strip())
+        safe_summary = _BRANCH_STRIP_RE.sub("", summary)
+        safe_summary = _BRANCH_SPACE_RE.sub("-", safe_summary.strip())
         safe_summary = safe_summary[:40].rstrip("-")  # Limit length
 
         return f"feature/{issue_key}-{safe_summary}".lower()
 
-    def _get_tracker_name(self) -> str:
-        """Get current tracker name for logging."""
-        return self._settings.tracker.value.capitalize()
-
     async def run(self, issue_key: str) -> TaskResult:
         """
         Execute the full task workflow.
@@ -120,7 +129,7 @@ class TaskRunner:
         Returns:
             TaskResult with execution outcome
         """
-        tracker_name = self._get_tracker_name()
+        tracker_name = self._tracker_name
         state_machine = TaskStateMachine(
             jira_key=issue_key,  # Field name kept for compatibility
             max_retries=self._settings.workflow.max_retries,
@@ -132,7 +141,17 @@ class TaskRunner:
             state_machine.transition_to(TaskState.FETCHING, f"Fetching issue from {tracker_name}")
             self._log(issue_key, f"Fetching issue from {tracker_name}...")
 
-            issue = self._tracker.get_issue(issue_key)
+            # With a single project the repo is known up front, so fetch its
+            # base branch while the issue is being retrieved
+            projects = self._settings.projects
+            if len(projects) == 1:
+                issue, prefetched = await asyncio.gather(
+                    asyncio.to_thread(self._tracker.get_issue, issue_key),
+                    self._bitbucket.fetch_base_branch(projects[0].path, "develop"),
+                )
+            else:
+                issue = await asyncio.to_thread(self._tracker.get_issue, issue_key)
+                prefetched = False
             self._log(issue_key, f"Issue: {issue.summary}")
 
             # Find matching project
@@ -152,16 +171,18 @@ class TaskRunner:
             branch_name = self._generate_branch_name(issue_key, issue.summary)
             state_machine.set_branch(branch_name)
 
-            self._bitbucket.create_branch(
+            await self._bitbucket.create_branch(
                 project.path,
                 branch_name,
                 base_branch="develop",
+                fetch=not prefetched,
             )
             self._log(issue_key, f"Created branch: {branch_name}")
 
             # Update tracker to In Progress
             if self._settings.workflow.auto_update_tracker:
-                self._tracker.update_status(
+                await asyncio.to_thread(
+                    self._tracker.update_status,
                     issue_key,
                     self._settings.get_in_progress_status(),
                 )
@@ -185,7 +206,7 @@ class TaskRunner:
             self._log(issue_key, "Implementation completed")
 
             # Commit changes
-            self._bitbucket.commit_changes(
+            await self._bitbucket.commit_changes(
                 project.path,
                 f"{issue_key}: {issue.summary}",
             )
@@ -237,7 +258,7 @@ class TaskRunner:
                     self._log(issue_key, f"Fix attempt failed: {fix_response.error}")
 
                 # Commit fix
-                self._bitbucket.commit_changes(
+                await self._bitbucket.commit_changes(
                     project.path,
                     f"{issue_key}: Fix test failures (attempt {state_machine.context.attempt})",
                 )
@@ -246,11 +267,13 @@ class TaskRunner:
             state_machine.transition_to(TaskState.CREATING_PR, "Creating pull request")
             self._log(issue_key, "Creating pull request...")
 
-            # Push branch
-            self._bitbucket.push_branch(project.path, branch_name)
+            # Push branch and collect the diff summary concurrently
+            _, diff_summary = await asyncio.gather(
+                self._bitbucket.push_branch(project.path, branch_name),
+                self._bitbucket.get_diff_summary(project.path),
+            )
 
             # Generate PR description
-            diff_summary = self._bitbucket.get_diff_summary(project.path)
             pr_description = await self._claude.generate_pr_description(
                 issue.summary,
                 diff_summary,
@@ -258,7 +281,8 @@ class TaskRunner:
             )
 
             if self._settings.workflow.auto_create_pr:
-                pr = self._bitbucket.create_pull_request(
+                pr = await asyncio.to_thread(
+                    self._bitbucket.create_pull_request,
                     project.path,
                     title=f"{issue_key}: {issue.summary}",
                     description=pr_description,
@@ -276,17 +300,13 @@ class TaskRunner:
             state_machine.transition_to(TaskState.UPDATING_JIRA, f"Updating {tracker_name}")
 
             if self._settings.workflow.auto_update_tracker:
-                # Add comment with PR link
-                if state_machine.context.pr_url:
-                    self._tracker.add_comment(
-                        issue_key,
-                        f"Pull request created: {state_machine.context.pr_url}",
-                    )
-
-                # Update status to Done
-                self._tracker.update_status(
+                # Update status to Done and comment with the PR link in one call
+                pr_url = state_machine.context.pr_url
+                await asyncio.to_thread(
+                    self._tracker.transition_with_comment,
                     issue_key,
                     self._settings.get_done_status(),
+                    f"Pull request created: {pr_url}" if pr_url else None,
                 )
                 self._log(issue_key, f"{tracker_name} updated to Done")
 
@@ -312,3 +332,25 @@ class TaskRunner:
                 error_message=str(e),
                 attempts=state_machine.context.attempt,
             )
+
+    async def run_many(
+        self,
+        issue_keys: list[str],
+        concurrency: int = 4,
+    ) -> list[TaskResult]:
+        """
+        Execute several task workflows concurrently.
+
+        All runs share this runner's tracker/Bitbucket clients (and their
+        connection pools); each run gets its own state machine. Tasks for the
+        same project share its working tree, so keep concurrency at 1 unless
+        the issues target different projects.
+
+        Args:
+            issue_keys: Issue keys to run
+            concurrency: Maximum number of workflows running at once
+
+        Returns:
+            TaskResults in the same order as issue_keys
+        """
+        return await gather_limited(self.run, issue_keys, concurrency)
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import zlib
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from src.utils.concurrency import gather_limited
+
 
 class TrackerType(Enum):
     """Supported issue tracker types."""
@@ -15,9 +21,9 @@ class TrackerType(Enum):
     REDMINE = "redmine"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Issue:
-    """Universal issue data structure for all trackers."""
+    """Universal issue data structure for all trackers (immutable)."""
 
     # Common fields
     key: str  # Issue ID/key (e.g., "DEV-123" or "12345")
@@ -31,38 +37,60 @@ class Issue:
     project_name: str = ""
 
     # Extended fields
-    labels: list[str] = field(default_factory=list)
-    components: list[str] = field(default_factory=list)  # Jira components or Redmine categories
+    labels: tuple[str, ...] = ()
+    components: tuple[str, ...] = ()  # Jira components or Redmine categories
     tracker_type: TrackerType = TrackerType.JIRA
 
-    # Original data for reference
-    raw_data: dict[str, Any] = field(default_factory=dict)
+    # Original API response as compressed JSON (see pack_raw/decoded_raw),
+    # only kept when requested (keep_raw=True)
+    raw_data: bytes | None = field(default=None, compare=False, repr=False)
 
-    def to_prompt(self) -> str:
-        """Convert to prompt for Claude."""
-        tracker_name = self.tracker_type.value.capitalize()
-        parts = [
-            f"# {tracker_name} Issue: {self.key}",
-            f"## Summary: {self.summary}",
-            f"**Type:** {self.issue_type}",
-            f"**Status:** {self.status}",
-            f"**Priority:** {self.priority or 'None'}",
-            f"**Project:** {self.project_name or self.project_key}",
-        ]
+    # Derived values
+    tracker_name: str = field(default="", init=False, compare=False)
+    _prompt: str | None = field(default=None, init=False, repr=False, compare=False)
 
-        if self.labels:
-            parts.append(f"**Labels:** {', '.join(self.labels)}")
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tracker_name", self.tracker_type.value.capitalize())
 
-        if self.components:
-            parts.append(f"**Components/Categories:** {', '.join(self.components)}")
+    @staticmethod
+    def pack_raw(data: dict[str, Any]) -> bytes:
+        """Compress an API response for raw_data (JSON payloads shrink several-fold)."""
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
 
-        parts.extend([
-            "",
-            "## Description:",
-            self.description or "(No description)",
-        ])
+    def decoded_raw(self) -> dict[str, Any] | None:
+        """Original API response, if it was kept."""
+        if self.raw_data is None:
+            return None
+        return json.loads(zlib.decompress(self.raw_data))
 
-        return "\n".join(parts)
+    def to_prompt(self) -> str:
+        """Convert to prompt for Claude."""
+        if self._prompt is not None:
+            return self._prompt
+
+        labels_line = f"**Labels:** {', '.join(self.labels)}\n" if self.labels else ""
+        components_line = (
+            f"**Components/Categories:** {', '.join(self.components)}\n"
+            if self.components
+            else ""
+        )
+
+        # Fixed layout, so build it in one pass instead of growing a list
+        prompt = (
+            f"# {self.tracker_name} Issue: {self.key}\n"
+            f"## Summary: {self.summary}\n"
+            f"**Type:** {self.issue_type}\n"
+            f"**Status:** {self.status}\n"
+            f"**Priority:** {self.priority or 'None'}\n"
+            f"**Project:** {self.project_name or self.project_key}\n"
+            f"{labels_line}"
+            f"{components_line}"
+            "\n"
+            "## Description:\n"
+            f"{self.description or '(No description)'}"
+        )
+        object.__setattr__(self, "_prompt", prompt)
+        return prompt
 
 
 class IssueTrackerClient(ABC):
@@ -75,18 +103,42 @@ class IssueTrackerClient(ABC):
         pass
 
     @abstractmethod
-    def get_issue(self, issue_key: str) -> Issue:
+    def get_issue(self, issue_key: str, keep_raw: bool = False) -> Issue:
         """
         Fetch issue details.
 
         Args:
             issue_key: Issue identifier (e.g., "DEV-123" for Jira, "12345" for Redmine)
+            keep_raw: Keep the full API response (compressed) on Issue.raw_data
 
         Returns:
             Issue object with details
         """
         pass
 
+    async def get_issues(
+        self,
+        issue_keys: list[str],
+        concurrency: int = 16,
+    ) -> list[Issue]:
+        """
+        Fetch several issues concurrently.
+
+        Each get_issue call runs in a worker thread, so the round-trips
+        overlap instead of running back to back.
+
+        Args:
+            issue_keys: Issue identifiers
+            concurrency: Maximum number of requests in flight (keeps within
+                tracker rate limits)
+
+        Returns:
+            Issues in the same order as issue_keys
+        """
+        return await gather_limited(
+            lambda key: asyncio.to_thread(self.get_issue, key), issue_keys, concurrency
+        )
+
     @abstractmethod
     def update_status(self, issue_key: str, status_name: str) -> bool:
         """
@@ -115,11 +167,40 @@ class IssueTrackerClient(ABC):
         """
         pass
 
+    def transition_with_comment(
+        self,
+        issue_key: str,
+        status_name: str,
+        comment: str | None = None,
+    ) -> bool:
+        """
+        Update issue status and optionally add a comment.
+
+        Default implementation makes two calls (update_status, add_comment).
+        Override in subclasses whose API can do both in one request.
+
+        Args:
+            issue_key: Issue identifier
+            status_name: Target status name
+            comment: Comment text, or None for a plain status update
+
+        Returns:
+            True if both the status update and the comment succeeded
+        """
+        success = self.update_status(issue_key, status_name)
+        if comment:
+            success = self.add_comment(issue_key, comment) and success
+        return success
+
     @abstractmethod
     def test_connection(self) -> bool:
         """Test connection to the tracker."""
         pass
 
+    def close(self) -> None:
+        """Release pooled connections. Override in clients that hold any."""
+        pass
+
     def search_issues(
         self,
         query: str,
@@ -131,6 +212,20 @@ class IssueTrackerClient(ABC):
         """
         return []
 
+    async def iter_issues(
+        self,
+        query: str,
+        page_size: int = 50,
+    ) -> AsyncIterator[Issue]:
+        """
+        Stream search results page by page.
+
+        Default implementation yields the results of search_issues.
+        Override in subclasses that can paginate.
+        """
+        for issue in await asyncio.to_thread(self.search_issues, query, page_size):
+            yield issue
+
     def get_my_open_issues(self, project_key: str | None = None) -> list[Issue]:
         """
         Get open issues assigned to current user.
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import re
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -12,6 +13,12 @@ import httpx
 
 from src.config import Settings
 
+# Optional: libgit2 bindings for local, read-only git lookups
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,13 +41,101 @@ class BitbucketClient:
     def __init__(self, settings: Settings):
         self._settings = settings
         self._base_url = "https://api.bitbucket.org/2.0"
+        self._auth = httpx.BasicAuth(
+            settings.bitbucket.username,
+            settings.bitbucket.app_password,
+        )
+        self._http: httpx.Client | None = None
+        self._http_lock = threading.Lock()  # _get_http runs in to_thread workers
+        self._slug_cache: dict[str, str] = {}  # project_path -> repo slug
+        self._base_branches: dict[str, str] = {}  # project_path -> branched-from
+        self._repos: dict[str, pygit2.Repository] = {}  # Open libgit2 handles
+
+    def _get_http(self) -> httpx.Client:
+        """Get or create the shared HTTP client (keeps connections alive)."""
+        http = self._http
+        if http is None:
+            with self._http_lock:
+                # Re-check: another worker may have created it meanwhile
+                http = self._http
+                if http is None:
+                    http = self._http = httpx.Client(
+                        base_url=self._base_url,
+                        auth=self._auth,
+                        timeout=30.0,
+                    )
+        return http
+
+    def close(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        with self._http_lock:
+            http, self._http = self._http, None
+        if http is not None:
+            http.close()
+
+    def _open_repo(self, project_path: str) -> pygit2.Repository | None:
+        """Open (and keep) a libgit2 handle for the project, if pygit2 is installed."""
+        if pygit2 is None:
+            return None
+
+        repo = self._repos.get(project_path)
+        if repo is None:
+            try:
+                repo = pygit2.Repository(project_path)
+            except pygit2.GitError:
+                return None
+            self._repos[project_path] = repo
+        return repo
+
+    def _get_remote_url(self, project_path: str) -> str:
+        """Get the origin remote URL."""
+        repo = self._open_repo(project_path)
+        if repo is not None:
+            try:
+                return repo.remotes["origin"].url or ""
+            except KeyError:
+                pass
+
+        result = subprocess.run(
+            ["git", "remote", "get-url", "origin"],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+
+    async def _run_git(self, project_path: str, *args: str, capture_stdout: bool = False) -> str:
+        """
+        Run a git command without blocking the event loop.
 
-    def _get_auth(self) -> tuple[str, str]:
-        """Get authentication tuple."""
-        return (
-            self._settings.bitbucket.username,
-            self._settings.bitbucket.app_password,
+        Args:
+            project_path: Repository working directory
+            *args: Arguments passed to git
+            capture_stdout: Whether to collect stdout (discarded otherwise)
+
+        Returns:
+            Decoded stdout ("" unless capture_stdout)
+
+        Raises:
+            subprocess.CalledProcessError: If git exits with a non-zero status
+        """
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            cwd=project_path,
+            stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
         )
+        stdout, stderr = await process.communicate()
+        out = stdout.decode("utf-8", errors="replace") if stdout else ""
+        err = stderr.decode("utf-8", errors="replace")
+
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, ["git", *args], output=out, stderr=err
+            )
+        return out
 
     def _get_repo_slug(self, project_path: str) -> str | None:
         """
@@ -52,39 +147,53 @@ class BitbucketClient:
         Returns:
             Repository slug or None
         """
+        cached = self._slug_cache.get(project_path)
+        if cached is not None:
+            return cached
+
         try:
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            remote_url = result.stdout.strip()
+            remote_url = self._get_remote_url(project_path)
+
+            if "bitbucket.org" not in remote_url:
+                return None
 
-            # Parse repo slug from URL
             # SSH: git@bitbucket.org:workspace/repo.git
             # HTTPS: https://bitbucket.org/workspace/repo.git
-            patterns = [
-                r"bitbucket\.org[:/]([^/]+)/([^/.]+)",  # workspace/repo
-                r"bitbucket\.org[:/]([^/]+)/([^/.]+)\.git",
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, remote_url)
-                if match:
-                    return match.group(2)
+            tail = remote_url.strip().rstrip("/").removesuffix(".git")
+            slug = tail.rsplit("/", 1)[-1].rsplit(":", 1)[-1]
+            if not slug:
+                return None
 
-            return None
+            self._slug_cache[project_path] = slug
+            return slug
         except subprocess.CalledProcessError:
             logger.error(f"Failed to get git remote for {project_path}")
             return None
 
-    def create_branch(
+    async def fetch_base_branch(self, project_path: str, base_branch: str = "develop") -> bool:
+        """
+        Fetch the latest base branch from origin.
+
+        Args:
+            project_path: Path to project directory
+            base_branch: Branch to fetch
+
+        Returns:
+            True if successful
+        """
+        try:
+            await self._run_git(project_path, "fetch", "origin", base_branch)
+            return True
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to fetch {base_branch}: {e.stderr}")
+            return False
+
+    async def create_branch(
         self,
         project_path: str,
         branch_name: str,
         base_branch: str = "develop",
+        fetch: bool = True,
     ) -> bool:
         """
         Create a new branch locally and push to remote.
@@ -93,6 +202,8 @@ class BitbucketClient:
             project_path: Path to project directory
             branch_name: Name for new branch
             base_branch: Base branch to branch from
+            fetch: Fetch the base branch first (skip if already done via
+                fetch_base_branch)
 
         Returns:
             True if successful
@@ -100,38 +211,22 @@ class BitbucketClient:
         logger.info(f"Creating branch: {branch_name} from {base_branch}")
 
         try:
-            # Fetch latest
-            subprocess.run(
-                ["git", "fetch", "origin"],
-                cwd=project_path,
-                check=True,
-                capture_output=True,
-            )
-
-            # Checkout base branch
-            subprocess.run(
-                ["git", "checkout", base_branch],
-                cwd=project_path,
-                check=True,
-                capture_output=True,
-            )
-
-            # Pull latest
-            subprocess.run(
-                ["git", "pull", "origin", base_branch],
-                cwd=project_path,
-                check=True,
-                capture_output=True,
-            )
-
-            # Create and checkout new branch
-            subprocess.run(
-                ["git", "checkout", "-b", branch_name],
-                cwd=project_path,
-                check=True,
-                capture_output=True,
+            # Fetch latest base branch
+            if fetch:
+                await self._run_git(project_path, "fetch", "origin", base_branch)
+
+            # Create and checkout new branch straight off the fetched remote
+            # ref (no need to checkout and pull the local base branch first)
+            await self._run_git(
+                project_path,
+                "checkout",
+                "--no-track",
+                "-b",
+                branch_name,
+                f"origin/{base_branch}",
             )
 
+            self._base_branches[project_path] = base_branch
             logger.info(f"Branch {branch_name} created successfully")
             return True
 
@@ -139,7 +234,7 @@ class BitbucketClient:
             logger.error(f"Failed to create branch: {e.stderr}")
             return False
 
-    def push_branch(self, project_path: str, branch_name: str) -> bool:
+    async def push_branch(self, project_path: str, branch_name: str) -> bool:
         """
         Push branch to remote.
 
@@ -153,12 +248,7 @@ class BitbucketClient:
         logger.info(f"Pushing branch: {branch_name}")
 
         try:
-            subprocess.run(
-                ["git", "push", "-u", "origin", branch_name],
-                cwd=project_path,
-                check=True,
-                capture_output=True,
-            )
+            await self._run_git(project_path, "push", "-u", "origin", branch_name)
             logger.info(f"Branch {branch_name} pushed successfully")
             return True
 
@@ -166,7 +256,7 @@ class BitbucketClient:
             logger.error(f"Failed to push branch: {e.stderr}")
             return False
 
-    def commit_changes(
+    async def commit_changes(
         self,
         project_path: str,
         message: str,
@@ -187,26 +277,16 @@ class BitbucketClient:
 
         try:
             if add_all:
-                subprocess.run(
-                    ["git", "add", "-A"],
-                    cwd=project_path,
-                    check=True,
-                    capture_output=True,
-                )
-
-            subprocess.run(
-                ["git", "commit", "-m", message],
-                cwd=project_path,
-                check=True,
-                capture_output=True,
-            )
+                await self._run_git(project_path, "add", "-A")
+
+            await self._run_git(project_path, "commit", "-m", message, capture_stdout=True)
 
             logger.info("Changes committed successfully")
             return True
 
         except subprocess.CalledProcessError as e:
-            # No changes to commit is not an error
-            if "nothing to commit" in str(e.stderr):
+            # No changes to commit is not an error (git reports it on stdout)
+            if "nothing to commit" in f"{e.stdout}{e.stderr}":
                 logger.info("No changes to commit")
                 return True
             logger.error(f"Failed to commit: {e.stderr}")
@@ -241,7 +321,7 @@ class BitbucketClient:
             return None
 
         workspace = self._settings.bitbucket.workspace
-        url = f"{self._base_url}/repositories/{workspace}/{repo_slug}/pullrequests"
+        url = f"/repositories/{workspace}/{repo_slug}/pullrequests"
 
         payload = {
             "title": title,
@@ -260,28 +340,22 @@ class BitbucketClient:
         }
 
         try:
-            with httpx.Client() as client:
-                response = client.post(
-                    url,
-                    json=payload,
-                    auth=self._get_auth(),
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                pr = PullRequest(
-                    id=data.get("id"),
-                    title=data.get("title"),
-                    description=data.get("description", ""),
-                    source_branch=source_branch,
-                    target_branch=target_branch,
-                    url=data.get("links", {}).get("html", {}).get("href", ""),
-                    state=data.get("state"),
-                )
-
-                logger.info(f"PR created: {pr.url}")
-                return pr
+            response = self._get_http().post(url, json=payload)
+            response.raise_for_status()
+            data = response.json()
+
+            pr = PullRequest(
+                id=data.get("id"),
+                title=data.get("title"),
+                description=data.get("description", ""),
+                source_branch=source_branch,
+                target_branch=target_branch,
+                url=data.get("links", {}).get("html", {}).get("href", ""),
+                state=data.get("state"),
+            )
+
+            logger.info(f"PR created: {pr.url}")
+            return pr
 
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to create PR: {e.response.text}")
@@ -290,26 +364,54 @@ class BitbucketClient:
             logger.error(f"Failed to create PR: {e}")
             return None
 
-    def get_diff_summary(self, project_path: str) -> str:
+    def _libgit2_diff_summary(self, project_path: str, base_branch: str) -> str | None:
+        """Diff stat since the branch left base_branch via pygit2, or None to use the git CLI."""
+        repo = self._open_repo(project_path)
+        if repo is None:
+            return None
+
+        try:
+            head = repo.revparse_single("HEAD")
+            base = repo.revparse_single(f"origin/{base_branch}")
+            merge_base = repo.merge_base(base.id, head.id)
+            if merge_base is None:
+                return None  # No common ancestor; let git report it
+            diff = repo.diff(repo[merge_base], head)
+            return diff.stats.format(pygit2.GIT_DIFF_STATS_FULL, 80).strip()
+        except (KeyError, ValueError, TypeError, pygit2.GitError):
+            return None
+
+    async def get_diff_summary(self, project_path: str, base_branch: str | None = None) -> str:
         """
         Get summary of changes for PR description.
 
         Args:
             project_path: Path to project directory
+            base_branch: Branch the work branched from (defaults to the one
+                used by create_branch, or "develop")
 
         Returns:
             Diff summary string
         """
+        if base_branch is None:
+            base_branch = self._base_branches.get(project_path, "develop")
+
+        # libgit2 diffs are synchronous, so keep them off the event loop
+        summary = await asyncio.to_thread(self._libgit2_diff_summary, project_path, base_branch)
+        if summary is not None:
+            return summary
+
         try:
-            # Get changed files
-            result = subprocess.run(
-                ["git", "diff", "--stat", "HEAD~1"],
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                check=True,
+            # All changes on this branch since it left the base branch
+            output = await self._run_git(
+                project_path,
+                "diff",
+                "--stat",
+                "--no-renames",
+                f"origin/{base_branch}...HEAD",
+                capture_stdout=True,
             )
-            return result.stdout.strip()
+            return output.strip()
         except subprocess.CalledProcessError:
             return ""
 
@@ -317,17 +419,13 @@ class BitbucketClient:
         """Test Bitbucket connection."""
         try:
             workspace = self._settings.bitbucket.workspace
-            url = f"{self._base_url}/repositories/{workspace}"
-
-            with httpx.Client() as client:
-                response = client.get(
-                    url,
-                    auth=self._get_auth(),
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                logger.info("Bitbucket connection successful")
-                return True
+            response = self._get_http().get(
+                f"/repositories/{workspace}",
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            logger.info("Bitbucket connection successful")
+            return True
 
         except Exception as e:
             logger.error(f"Bitbucket connection failed: {e}")
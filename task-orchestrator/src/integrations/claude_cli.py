@@ -6,23 +6,100 @@ import asyncio
 import logging
 import subprocess
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import AsyncGenerator
 
 from src.config import Settings
+from src.utils.concurrency import gather_limited
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from the CLI's stdout per call when streaming
+_STREAM_CHUNK_SIZE = 64 * 1024
 
-@dataclass
+# Prompt templates: the fixed instructions come first so consecutive prompts
+# share a byte-identical prefix (cacheable); per-task data is appended last
+_IMPLEMENT_PROMPT_PREFIX = """Please implement the task below.
+
+Requirements:
+- Write clean, maintainable code
+- Follow existing project patterns and conventions
+- Add appropriate error handling
+- Include comments where necessary
+
+Task:
+"""
+
+_FIX_PROMPT_PREFIX = """The tests are failing. Please analyze the errors below and fix the code to make the tests pass.
+Focus on:
+1. Understanding what the test expects
+2. Finding the root cause of the failure
+3. Fixing the implementation (not the test, unless the test is clearly wrong)
+
+Test errors:
+"""
+
+_PR_DESCRIPTION_PROMPT_PREFIX = """Generate a concise pull request description for the task and changes below.
+
+Format the description with:
+- Brief summary (1-2 sentences)
+- List of key changes
+- Any important notes for reviewers
+
+Output only the PR description, no extra commentary.
+
+"""
+
+
+@dataclass(init=False)
 class ClaudeResponse:
     """Response from Claude CLI."""
 
     success: bool
-    output: str
-    error: str = ""
+    # Raw process output; decoded to text only when output/error is read
+    output_bytes: bytes = b""
+    error_bytes: bytes = b""
     exit_code: int = 0
 
+    def __init__(
+        self,
+        success: bool,
+        output: str | None = None,
+        error: str | None = None,
+        exit_code: int = 0,
+        *,
+        output_bytes: bytes = b"",
+        error_bytes: bytes = b"",
+    ):
+        # output/error text is still accepted (and takes precedence) so
+        # responses can be built by hand as before
+        self.success = success
+        self.exit_code = exit_code
+        self.output_bytes = output_bytes
+        self.error_bytes = error_bytes
+        if output is not None:
+            self.output_bytes = output.encode("utf-8")
+            self.__dict__["output"] = output
+        if error is not None:
+            self.error_bytes = error.encode("utf-8")
+            self.__dict__["error"] = error
+
+    @cached_property
+    def output(self) -> str:
+        """Decoded stdout."""
+        return self.output_bytes.decode("utf-8", errors="replace")
+
+    @cached_property
+    def error(self) -> str:
+        """Decoded stderr (or the failure message)."""
+        return self.error_bytes.decode("utf-8", errors="replace")
+
+    @classmethod
+    def failure(cls, error: str) -> ClaudeResponse:
+        """Build a response for a run that failed before producing output."""
+        return cls(success=False, error=error, exit_code=-1)
+
 
 class ClaudeCLI:
     """Wrapper for Claude CLI operations."""
@@ -32,6 +109,11 @@ class ClaudeCLI:
         self._cli_path = settings.claude.cli_path
         self._timeout = settings.claude.timeout_minutes * 60  # Convert to seconds
 
+        # Arguments shared by every invocation (the prompt is appended per call)
+        self._model_args = ["--model", settings.claude.model] if settings.claude.model else []
+
+        self._cli_available: bool | None = None  # Cached test_cli_available result
+
     def _build_command(
         self,
         prompt: str,
@@ -39,17 +121,9 @@ class ClaudeCLI:
         print_mode: bool = True,
     ) -> list[str]:
         """Build Claude CLI command."""
-        cmd = [self._cli_path]
-
         if print_mode:
-            cmd.append("--print")
-
-        # Add model if specified
-        if self._settings.claude.model:
-            cmd.extend(["--model", self._settings.claude.model])
-
-        cmd.append(prompt)
-        return cmd
+            return [self._cli_path, "--print", *self._model_args, prompt]
+        return [self._cli_path, *self._model_args, prompt]
 
     async def execute(
         self,
@@ -87,27 +161,36 @@ class ClaudeCLI:
 
             return ClaudeResponse(
                 success=process.returncode == 0,
-                output=stdout.decode("utf-8", errors="replace"),
-                error=stderr.decode("utf-8", errors="replace"),
+                output_bytes=stdout,
+                error_bytes=stderr,
                 exit_code=process.returncode or 0,
             )
 
         except asyncio.TimeoutError:
             logger.error(f"Claude CLI timed out after {self._timeout}s")
-            return ClaudeResponse(
-                success=False,
-                output="",
-                error=f"Timeout after {self._settings.claude.timeout_minutes} minutes",
-                exit_code=-1,
+            return ClaudeResponse.failure(
+                f"Timeout after {self._settings.claude.timeout_minutes} minutes"
             )
         except Exception as e:
             logger.error(f"Claude CLI execution failed: {e}")
-            return ClaudeResponse(
-                success=False,
-                output="",
-                error=str(e),
-                exit_code=-1,
-            )
+            return ClaudeResponse.failure(str(e))
+
+    async def execute_many(
+        self,
+        jobs: list[tuple[str, str]],
+        concurrency: int = 4,
+    ) -> list[ClaudeResponse]:
+        """
+        Execute several independent prompts concurrently.
+
+        Args:
+            jobs: (prompt, project_path) pairs
+            concurrency: Maximum CLI processes at once
+
+        Returns:
+            ClaudeResponses in the same order as jobs
+        """
+        return await gather_limited(lambda job: self.execute(*job), jobs, concurrency)
 
     async def stream_execute(
         self,
@@ -135,9 +218,16 @@ class ClaudeCLI:
         )
 
         try:
-            async for line in process.stdout:
-                decoded = line.decode("utf-8", errors="replace").rstrip()
-                yield decoded
+            # Read in large chunks and split lines here: fewer wakeups than
+            # readline(), and no limit on line length
+            buffer = b""
+            while chunk := await process.stdout.read(_STREAM_CHUNK_SIZE):
+                *lines, buffer = (buffer + chunk).split(b"\n")
+                for line in lines:
+                    yield line.decode("utf-8", errors="replace").rstrip()
+
+            if buffer:
+                yield buffer.decode("utf-8", errors="replace").rstrip()
 
             await process.wait()
 
@@ -165,35 +255,53 @@ class ClaudeCLI:
         logger.info(f"Executing Claude CLI (sync) in {project_path}")
 
         try:
-            result = subprocess.run(
+            # Keep raw bytes; ClaudeResponse decodes them on first access
+            with subprocess.Popen(
                 cmd,
                 cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=self._timeout,
-            )
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            ) as process:
+                try:
+                    stdout, stderr = process.communicate(timeout=self._timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.communicate()
+                    raise
 
             return ClaudeResponse(
-                success=result.returncode == 0,
-                output=result.stdout,
-                error=result.stderr,
-                exit_code=result.returncode,
+                success=process.returncode == 0,
+                output_bytes=stdout,
+                error_bytes=stderr,
+                exit_code=process.returncode,
             )
 
         except subprocess.TimeoutExpired:
-            return ClaudeResponse(
-                success=False,
-                output="",
-                error=f"Timeout after {self._settings.claude.timeout_minutes} minutes",
-                exit_code=-1,
+            return ClaudeResponse.failure(
+                f"Timeout after {self._settings.claude.timeout_minutes} minutes"
             )
         except Exception as e:
-            return ClaudeResponse(
-                success=False,
-                output="",
-                error=str(e),
-                exit_code=-1,
-            )
+            return ClaudeResponse.failure(str(e))
+
+    async def execute_sync_async(
+        self,
+        prompt: str,
+        project_path: str,
+    ) -> ClaudeResponse:
+        """
+        Run execute_sync in a worker thread.
+
+        Use this instead of execute_sync from async code; it blocks a worker
+        thread rather than the event loop.
+
+        Args:
+            prompt: The prompt/instruction for Claude
+            project_path: Working directory
+
+        Returns:
+            ClaudeResponse with result
+        """
+        return await asyncio.to_thread(self.execute_sync, prompt, project_path)
 
     async def implement_task(
         self,
@@ -212,19 +320,9 @@ class ClaudeCLI:
         Returns:
             ClaudeResponse with result
         """
-        prompt = f"""Please implement the following task:
-
-{task_description}
-
-{additional_context}
-
-Requirements:
-- Write clean, maintainable code
-- Follow existing project patterns and conventions
-- Add appropriate error handling
-- Include comments where necessary
-
-Please implement this task now."""
+        prompt = _IMPLEMENT_PROMPT_PREFIX + task_description
+        if additional_context:
+            prompt += f"\n\n{additional_context}"
 
         return await self.execute(prompt, project_path)
 
@@ -245,19 +343,7 @@ Please implement this task now."""
         Returns:
             ClaudeResponse with result
         """
-        prompt = f"""The tests are failing with the following errors:
-
-```
-{error_log}
-```
-
-Please analyze the error and fix the code to make the tests pass.
-Focus on:
-1. Understanding what the test expects
-2. Finding the root cause of the failure
-3. Fixing the implementation (not the test, unless the test is clearly wrong)
-
-Fix the issues now."""
+        prompt = f"{_FIX_PROMPT_PREFIX}```\n{error_log}\n```"
 
         return await self.execute(prompt, project_path)
 
@@ -278,25 +364,31 @@ Fix the issues now."""
         Returns:
             Generated PR description
         """
-        prompt = f"""Generate a concise pull request description for the following:
+        prompt = (
+            f"{_PR_DESCRIPTION_PROMPT_PREFIX}"
+            f"Task: {task_description}\n\n"
+            f"Changes made:\n{changes_summary}"
+        )
 
-Task: {task_description}
+        response = await self.execute(prompt, project_path)
+        return response.output if response.success else ""
 
-Changes made:
-{changes_summary}
+    def test_cli_available(self, refresh: bool = False) -> bool:
+        """
+        Check if Claude CLI is available.
 
-Format the description with:
-- Brief summary (1-2 sentences)
-- List of key changes
-- Any important notes for reviewers
+        The result is cached for this instance, since the binary doesn't
+        change while running.
 
-Output only the PR description, no extra commentary."""
+        Args:
+            refresh: Probe the CLI again instead of using the cached result
 
-        response = await self.execute(prompt, project_path)
-        return response.output if response.success else ""
+        Returns:
+            True if the CLI ran successfully
+        """
+        if self._cli_available is not None and not refresh:
+            return self._cli_available
 
-    def test_cli_available(self) -> bool:
-        """Check if Claude CLI is available."""
         try:
             result = subprocess.run(
                 [self._cli_path, "--version"],
@@ -305,7 +397,8 @@ Output only the PR description, no extra commentary."""
                 timeout=10,
             )
             logger.info(f"Claude CLI available: {result.stdout.strip()}")
-            return result.returncode == 0
+            self._cli_available = result.returncode == 0
         except Exception as e:
             logger.error(f"Claude CLI not available: {e}")
-            return False
+            self._cli_available = False
+        return self._cli_available
@@ -2,16 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
-
-from atlassian import Jira
+import sys
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import TYPE_CHECKING, Any
 
 from src.config import Settings
 from src.integrations.base import Issue, IssueTrackerClient, TrackerType
 
+# atlassian-python-api (and requests under it) is slow to import, so it is
+# only loaded once a Jira client is actually created
+if TYPE_CHECKING:
+    from atlassian import Jira
+
 logger = logging.getLogger(__name__)
 
+# Fields requested for search results and plain issue fetches (everything
+# _parse_issue reads)
+_SEARCH_FIELDS = [
+    "summary",
+    "description",
+    "issuetype",
+    "status",
+    "assignee",
+    "project",
+    "labels",
+    "components",
+    "priority",
+]
+
+# Jira Cloud caps maxResults per search request at this value
+_MAX_PAGE_SIZE = 100
+
+# Seconds a project's transition name -> ID map is reused
+_TRANSITION_CACHE_TTL = 300.0
+
 
 class JiraClient(IssueTrackerClient):
     """Client for Jira API operations."""
@@ -19,6 +46,8 @@ class JiraClient(IssueTrackerClient):
     def __init__(self, settings: Settings):
         self._settings = settings
         self._client: Jira | None = None
+        # project key -> (fetched at, lowercased transition/target status name -> ID)
+        self._transition_cache: dict[str, tuple[float, dict[str, Any]]] = {}
 
     @property
     def tracker_type(self) -> TrackerType:
@@ -27,6 +56,8 @@ class JiraClient(IssueTrackerClient):
     def _get_client(self) -> Jira:
         """Get or create Jira client."""
         if self._client is None:
+            from atlassian import Jira
+
             self._client = Jira(
                 url=self._settings.jira.url,
                 username=self._settings.jira.email,
@@ -35,39 +66,45 @@ class JiraClient(IssueTrackerClient):
             )
         return self._client
 
-    def _parse_issue(self, data: dict[str, Any]) -> Issue:
+    def _parse_issue(self, data: dict[str, Any], keep_raw: bool = False) -> Issue:
         """Parse Jira API response to Issue object."""
         fields = data.get("fields", {})
+        priority = (fields.get("priority") or {}).get("name")
+        # Low-cardinality values repeat across issues; intern them so a page
+        # of results shares one copy of each
         return Issue(
             key=data.get("key", ""),
             summary=fields.get("summary", ""),
             description=fields.get("description", "") or "",
-            issue_type=fields.get("issuetype", {}).get("name", ""),
-            status=fields.get("status", {}).get("name", ""),
+            issue_type=sys.intern(fields.get("issuetype", {}).get("name", "")),
+            status=sys.intern(fields.get("status", {}).get("name", "")),
             assignee=fields.get("assignee", {}).get("displayName") if fields.get("assignee") else None,
-            project_key=fields.get("project", {}).get("key", ""),
-            project_name=fields.get("project", {}).get("name", ""),
-            labels=fields.get("labels", []),
-            components=[c.get("name", "") for c in fields.get("components", [])],
-            priority=fields.get("priority", {}).get("name") if fields.get("priority") else None,
+            project_key=sys.intern(fields.get("project", {}).get("key", "")),
+            project_name=sys.intern(fields.get("project", {}).get("name", "")),
+            labels=tuple(fields.get("labels", [])),
+            components=tuple(c.get("name", "") for c in fields.get("components", [])),
+            priority=sys.intern(priority) if priority is not None else None,
             tracker_type=TrackerType.JIRA,
-            raw_data=data,
+            raw_data=Issue.pack_raw(data) if keep_raw else None,
         )
 
-    def get_issue(self, issue_key: str) -> Issue:
+    def get_issue(self, issue_key: str, keep_raw: bool = False) -> Issue:
         """
         Fetch issue details from Jira.
 
         Args:
             issue_key: Jira issue key (e.g., "DEV-123")
+            keep_raw: Keep the full API response (compressed) on Issue.raw_data
 
         Returns:
             Issue object with issue details
         """
         logger.info(f"Fetching Jira issue: {issue_key}")
         client = self._get_client()
-        data = client.issue(issue_key)
-        return self._parse_issue(data)
+        # Without keep_raw only the fields _parse_issue reads are worth fetching
+        fields = "*all" if keep_raw else ",".join(_SEARCH_FIELDS)
+        data = client.issue(issue_key, fields=fields)
+        return self._parse_issue(data, keep_raw)
 
     def update_status(self, issue_key: str, status_name: str) -> bool:
         """
@@ -80,32 +117,106 @@ class JiraClient(IssueTrackerClient):
         Returns:
             True if successful
         """
+        return self.transition_with_comment(issue_key, status_name)
+
+    def transition_with_comment(
+        self,
+        issue_key: str,
+        status_name: str,
+        comment: str | None = None,
+    ) -> bool:
+        """
+        Transition an issue and optionally comment on it in a single request.
+
+        Args:
+            issue_key: Jira issue key
+            status_name: Target status name (e.g., "Done", "In Progress")
+            comment: Comment text added as part of the transition
+
+        Returns:
+            True if successful
+        """
+        from requests import HTTPError
+
         logger.info(f"Updating {issue_key} status to: {status_name}")
         client = self._get_client()
+        url = f"{client.resource_url('issue')}/{issue_key}/transitions"
+
+        payload: dict[str, Any] = {"transition": {"id": None}}
+        if comment:
+            payload["update"] = {"comment": [{"add": {"body": comment}}]}
+
+        # Try the cached transition IDs first; if the status is missing or the
+        # transition is rejected (the issue is at another workflow step),
+        # refresh from this issue and try once more
+        for refresh in (False, True):
+            transition_ids = self._get_transition_ids(issue_key, refresh=refresh)
+            transition_id = transition_ids.get(status_name.lower())
+            if transition_id is None:
+                continue
+
+            payload["transition"]["id"] = transition_id
+            try:
+                client.post(url, data=payload)
+            except HTTPError:
+                if refresh:
+                    raise
+                continue
+
+            logger.info(f"Successfully transitioned {issue_key} to {status_name}")
+            return True
 
-        # Get available transitions
-        transitions = client.get_issue_transitions(issue_key)
-        target_transition = None
+        logger.warning(f"Transition to '{status_name}' not found for {issue_key}")
+        logger.debug(f"Available transitions: {list(transition_ids)}")
+        if comment:
+            # Still leave the comment even though the status can't change
+            self.add_comment(issue_key, comment)
+        return False
 
-        for t in transitions:
-            if t.get("name", "").lower() == status_name.lower():
-                target_transition = t
-                break
-            # Also check "to" status name
-            to_status = t.get("to", {}).get("name", "")
-            if to_status.lower() == status_name.lower():
-                target_transition = t
-                break
+    def _get_transition_ids(self, issue_key: str, refresh: bool = False) -> dict[str, Any]:
+        """
+        Get transition IDs by lowercased transition and target status name.
 
-        if not target_transition:
-            logger.warning(f"Transition to '{status_name}' not found for {issue_key}")
-            available = [t.get("name") for t in transitions]
-            logger.debug(f"Available transitions: {available}")
-            return False
+        Transition IDs come from the project's workflow, so they are cached
+        per project (merged across issues) for _TRANSITION_CACHE_TTL seconds.
 
-        client.issue_transition(issue_key, target_transition["id"])
-        logger.info(f"Successfully transitioned {issue_key} to {status_name}")
-        return True
+        Args:
+            issue_key: Jira issue key (its transitions are fetched on a miss)
+            refresh: Ignore the cached entry and fetch again
+
+        Returns:
+            Mapping of lowercased names to transition IDs (only the issue's
+            own transitions when fetched)
+        """
+        project_key = issue_key.rsplit("-", 1)[0]
+        now = time.monotonic()
+
+        cached = self._transition_cache.get(project_key)
+        if cached is not None and now - cached[0] >= _TRANSITION_CACHE_TTL:
+            cached = None
+        if not refresh and cached is not None:
+            return cached[1]
+
+        transitions = self._get_client().get_issue_transitions(issue_key)
+
+        # Transition names take precedence over target status names
+        transition_ids: dict[str, Any] = {}
+        for t in transitions:
+            transition_ids.setdefault(t.get("name", "").lower(), t["id"])
+        for t in transitions:
+            # "to" is the target status name (a dict in the raw REST response)
+            to_status = t.get("to") or ""
+            if isinstance(to_status, dict):
+                to_status = to_status.get("name", "")
+            transition_ids.setdefault(to_status.lower(), t["id"])
+
+        # Issues at other workflow steps offer other transitions; keep those
+        # already seen for the project, but return only this issue's own
+        if cached is not None:
+            self._transition_cache[project_key] = (now, {**cached[1], **transition_ids})
+        else:
+            self._transition_cache[project_key] = (now, transition_ids)
+        return transition_ids
 
     def add_comment(self, issue_key: str, comment: str) -> bool:
         """
@@ -139,21 +250,101 @@ class JiraClient(IssueTrackerClient):
             List of Issue objects
         """
         logger.info(f"Searching Jira: {query}")
-        client = self._get_client()
 
-        result = client.jql(
-            query,
-            limit=max_results,
-            fields=["summary", "description", "issuetype", "status", "assignee", "project", "labels", "components", "priority"],
-        )
-
-        issues = []
-        for item in result.get("issues", []):
-            issues.append(self._parse_issue(item))
+        issues = [
+            self._parse_issue(item)
+            for item in self._search_pages(query, max_results, _SEARCH_FIELDS)
+        ]
 
         logger.info(f"Found {len(issues)} issues")
         return issues
 
+    def search_keys(
+        self,
+        query: str,
+        max_results: int = 1000,
+    ) -> tuple[list[str], list[str]]:
+        """
+        Search issues using JQL, returning only keys and summaries.
+
+        Requests just the summary field and skips building Issue objects,
+        for callers that list or count matches.
+
+        Args:
+            query: JQL query string
+            max_results: Maximum number of results
+
+        Returns:
+            Parallel lists of issue keys and summaries
+        """
+        logger.info(f"Searching Jira (keys only): {query}")
+
+        keys: list[str] = []
+        summaries: list[str] = []
+        for item in self._search_pages(query, max_results, ["summary"]):
+            keys.append(item.get("key", ""))
+            summaries.append(item.get("fields", {}).get("summary", ""))
+        return keys, summaries
+
+    def _search_pages(
+        self,
+        query: str,
+        max_results: int,
+        fields: list[str],
+    ) -> Iterator[dict[str, Any]]:
+        """Yield raw search results, paging through up to max_results."""
+        client = self._get_client()
+        start = 0
+
+        while start < max_results:
+            result = client.jql(
+                query,
+                start=start,
+                limit=min(_MAX_PAGE_SIZE, max_results - start),
+                fields=fields,
+            )
+            items = result.get("issues", [])
+            yield from items
+
+            start += len(items)
+            if not items or start >= result.get("total", 0):
+                break
+
+    async def iter_issues(
+        self,
+        query: str,
+        page_size: int = 50,
+    ) -> AsyncIterator[Issue]:
+        """
+        Stream JQL search results one page at a time.
+
+        Args:
+            query: JQL query string
+            page_size: Issues fetched per request
+
+        Yields:
+            Issue objects as each page arrives
+        """
+        logger.info(f"Streaming Jira search: {query}")
+        client = self._get_client()
+        start = 0
+
+        while True:
+            result = await asyncio.to_thread(
+                client.jql,
+                query,
+                start=start,
+                limit=page_size,
+                fields=_SEARCH_FIELDS,
+            )
+            items = result.get("issues", [])
+            for item in items:
+                yield self._parse_issue(item)
+
+            start += len(items)
+            if not items or start >= result.get("total", 0):
+                break
+
     def get_my_open_issues(self, project_key: str | None = None) -> list[Issue]:
         """
         Get open issues assigned to current user.
@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import json
 import logging
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
@@ -10,8 +17,26 @@ import httpx
 from src.config import Settings
 from src.integrations.base import Issue, IssueTrackerClient, TrackerType
 
+# Optional: faster C JSON decoder for large issue listings
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of GET responses kept for conditional requests
+_RESPONSE_CACHE_SIZE = 256
+
+
+def _matches_query(item: dict[str, Any], query_lower: str) -> bool:
+    """Whether an issue's subject or description contains the (lowercased) query."""
+    # Only lowercase the description when the subject doesn't match
+    return (
+        query_lower in item.get("subject", "").lower()
+        or query_lower in (item.get("description") or "").lower()
+    )
+
 
 class RedmineClient(IssueTrackerClient):
     """Client for Redmine API operations."""
@@ -20,17 +45,47 @@ class RedmineClient(IssueTrackerClient):
         self._settings = settings
         self._base_url = settings.redmine.url.rstrip("/")
         self._api_key = settings.redmine.api_key
+        # Request headers with API key (fixed for the client's lifetime)
+        self._headers = {
+            "X-Redmine-API-Key": self._api_key,
+            "Content-Type": "application/json",
+        }
+        self._http: httpx.Client | None = None
+        self._http_lock = threading.Lock()  # _get_http runs in to_thread workers
+        self._status_ids: dict[str, int] | None = None  # Lowercased name -> ID
+        self._server_search = True  # Cleared if the server rejects the text filter
+        # (endpoint, params) -> (ETag, decoded body) for conditional GETs,
+        # oldest first; shared by worker threads, so guarded by a lock
+        self._response_cache: OrderedDict[tuple[str, str], tuple[str, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._cache_lock = threading.Lock()
 
     @property
     def tracker_type(self) -> TrackerType:
         return TrackerType.REDMINE
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get request headers with API key."""
-        return {
-            "X-Redmine-API-Key": self._api_key,
-            "Content-Type": "application/json",
-        }
+    def _get_http(self) -> httpx.Client:
+        """Get or create the shared HTTP client (keeps connections alive)."""
+        http = self._http
+        if http is None:
+            with self._http_lock:
+                # Re-check: another worker may have created it meanwhile
+                http = self._http
+                if http is None:
+                    http = self._http = httpx.Client(
+                        base_url=self._base_url,
+                        headers=self._headers,
+                        timeout=30.0,
+                    )
+        return http
+
+    def close(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        with self._http_lock:
+            http, self._http = self._http, None
+        if http is not None:
+            http.close()
 
     def _make_request(
         self,
@@ -40,45 +95,74 @@ class RedmineClient(IssueTrackerClient):
         params: dict | None = None,
     ) -> dict[str, Any]:
         """Make API request to Redmine."""
-        url = f"{self._base_url}{endpoint}"
-
-        with httpx.Client(timeout=30.0) as client:
-            response = client.request(
-                method,
-                url,
-                headers=self._get_headers(),
-                json=data,
-                params=params,
-            )
-            response.raise_for_status()
+        headers = None
+
+        cache_key = None
+        cached = None
+        if method == "GET":
+            cache_key = (endpoint, repr(sorted(params.items())) if params else "")
+            with self._cache_lock:
+                cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                headers = {"If-None-Match": cached[0]}
+        else:
+            # Writes may change anything we have cached
+            with self._cache_lock:
+                self._response_cache.clear()
+
+        response = self._get_http().request(
+            method,
+            endpoint,
+            headers=headers,
+            json=data,
+            params=params,
+        )
+
+        # Unchanged since the last fetch, reuse (a copy of) the cached body
+        if cached is not None and response.status_code == 304:
+            return copy.deepcopy(cached[1])
+
+        response.raise_for_status()
 
-            if response.content:
-                return response.json()
-            return {}
+        result = _json_loads(response.content) if response.content else {}
 
-    def get_issue(self, issue_key: str) -> Issue:
+        etag = response.headers.get("ETag")
+        if cache_key is not None and etag:
+            # Cache a private copy, so callers can't change the entry
+            entry = (etag, copy.deepcopy(result))
+            with self._cache_lock:
+                self._response_cache[cache_key] = entry
+                self._response_cache.move_to_end(cache_key)
+                while len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+
+        return result
+
+    def get_issue(self, issue_key: str, keep_raw: bool = False) -> Issue:
         """
         Fetch issue details from Redmine.
 
         Args:
             issue_key: Redmine issue ID (numeric string like "12345")
+            keep_raw: Keep the full API response (compressed) on Issue.raw_data
 
         Returns:
             Issue object with details
         """
         logger.info(f"Fetching Redmine issue: {issue_key}")
 
-        # Include journals for comments, attachments, etc.
+        # Journals, attachments and watchers only end up in raw_data, so skip
+        # the (often large) includes unless it is kept
         data = self._make_request(
             "GET",
             f"/issues/{issue_key}.json",
-            params={"include": "attachments,journals,watchers"},
+            params={"include": "attachments,journals,watchers"} if keep_raw else None,
         )
 
         issue_data = data.get("issue", {})
-        return self._parse_issue(issue_data)
+        return self._parse_issue(issue_data, keep_raw)
 
-    def _parse_issue(self, data: dict[str, Any]) -> Issue:
+    def _parse_issue(self, data: dict[str, Any], keep_raw: bool = False) -> Issue:
         """Parse Redmine API response to Issue object."""
         # Extract custom fields as labels
         labels = []
@@ -92,20 +176,23 @@ class RedmineClient(IssueTrackerClient):
         if data.get("category"):
             components.append(data["category"].get("name", ""))
 
+        priority = data.get("priority", {}).get("name")
+        # Low-cardinality values repeat across issues; intern them so a page
+        # of results shares one copy of each
         return Issue(
             key=str(data.get("id", "")),
             summary=data.get("subject", ""),
             description=data.get("description", "") or "",
-            status=data.get("status", {}).get("name", ""),
-            issue_type=data.get("tracker", {}).get("name", ""),
-            priority=data.get("priority", {}).get("name"),
+            status=sys.intern(data.get("status", {}).get("name", "")),
+            issue_type=sys.intern(data.get("tracker", {}).get("name", "")),
+            priority=sys.intern(priority) if priority is not None else None,
             assignee=data.get("assigned_to", {}).get("name") if data.get("assigned_to") else None,
-            project_key=data.get("project", {}).get("identifier", ""),
-            project_name=data.get("project", {}).get("name", ""),
-            labels=labels,
-            components=components,
+            project_key=sys.intern(data.get("project", {}).get("identifier", "")),
+            project_name=sys.intern(data.get("project", {}).get("name", "")),
+            labels=tuple(labels),
+            components=tuple(components),
             tracker_type=TrackerType.REDMINE,
-            raw_data=data,
+            raw_data=Issue.pack_raw(data) if keep_raw else None,
         )
 
     def update_status(self, issue_key: str, status_name: str) -> bool:
@@ -119,37 +206,95 @@ class RedmineClient(IssueTrackerClient):
         Returns:
             True if successful
         """
-        logger.info(f"Updating {issue_key} status to: {status_name}")
+        return self.transition_with_comment(issue_key, status_name)
 
-        # First, get available statuses
-        status_id = self._find_status_id(status_name)
-        if not status_id:
-            logger.warning(f"Status '{status_name}' not found")
-            return False
+    def transition_with_comment(
+        self,
+        issue_key: str,
+        status_name: str,
+        comment: str | None = None,
+    ) -> bool:
+        """
+        Update issue status and optionally add a note in a single request.
+
+        Args:
+            issue_key: Redmine issue ID
+            status_name: Target status name (e.g., "Done", "In Progress")
+            comment: Note text added with the status change
+
+        Returns:
+            True if successful
+        """
+        return self.update_issue(issue_key, status_name=status_name, comment=comment)
+
+    def update_issue(
+        self,
+        issue_key: str,
+        status_name: str | None = None,
+        comment: str | None = None,
+    ) -> bool:
+        """
+        Change an issue's status and/or add a note with one PUT.
+
+        Args:
+            issue_key: Redmine issue ID
+            status_name: Target status name, or None to leave the status
+            comment: Note text, or None for no note
+
+        Returns:
+            True if every requested change was applied
+        """
+        fields: dict[str, Any] = {}
+        success = True
+
+        if status_name:
+            logger.info(f"Updating {issue_key} status to: {status_name}")
+            status_id = self._find_status_id(status_name)
+            if status_id:
+                fields["status_id"] = status_id
+            else:
+                # Still leave the note even though the status can't change
+                logger.warning(f"Status '{status_name}' not found")
+                success = False
+
+        if comment:
+            logger.info(f"Adding comment to {issue_key}")
+            fields["notes"] = comment
+
+        if not fields:
+            return success
 
         try:
             self._make_request(
                 "PUT",
                 f"/issues/{issue_key}.json",
-                data={"issue": {"status_id": status_id}},
+                data={"issue": fields},
             )
-            logger.info(f"Successfully updated {issue_key} to {status_name}")
-            return True
+            if "status_id" in fields:
+                logger.info(f"Successfully updated {issue_key} to {status_name}")
+            return success
         except httpx.HTTPStatusError as e:
-            logger.error(f"Failed to update status: {e}")
+            logger.error(f"Failed to update {issue_key}: {e}")
             return False
 
     def _find_status_id(self, status_name: str) -> int | None:
-        """Find status ID by name."""
-        try:
-            data = self._make_request("GET", "/issue_statuses.json")
-            statuses = data.get("issue_statuses", [])
+        """
+        Find status ID by name.
 
-            for status in statuses:
-                if status.get("name", "").lower() == status_name.lower():
-                    return status.get("id")
+        Statuses are global and rarely change, so they are fetched once and
+        refetched only when a name is not found.
+        """
+        name = status_name.lower()
+        if self._status_ids is not None and name in self._status_ids:
+            return self._status_ids[name]
 
-            return None
+        try:
+            data = self._make_request("GET", "/issue_statuses.json")
+            self._status_ids = {
+                status.get("name", "").lower(): status.get("id")
+                for status in data.get("issue_statuses", [])
+            }
+            return self._status_ids.get(name)
         except Exception as e:
             logger.error(f"Failed to get statuses: {e}")
             return None
@@ -165,18 +310,30 @@ class RedmineClient(IssueTrackerClient):
         Returns:
             True if successful
         """
-        logger.info(f"Adding comment to {issue_key}")
+        return self.update_issue(issue_key, comment=comment)
 
-        try:
-            self._make_request(
-                "PUT",
-                f"/issues/{issue_key}.json",
-                data={"issue": {"notes": comment}},
-            )
-            return True
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Failed to add comment: {e}")
-            return False
+    def _fetch_issue_page(self, params: dict[str, Any], query: str) -> dict[str, Any]:
+        """
+        GET /issues.json, narrowing by text on the server when possible.
+
+        Uses the any_searchable filter (Redmine 5+) so only candidate issues
+        are sent; callers still filter client-side, since the server also
+        matches journal notes (and older servers may ignore the filter).
+        """
+        if query and self._server_search:
+            try:
+                return self._make_request(
+                    "GET",
+                    "/issues.json",
+                    params={**params, "any_searchable": f"~{query}"},
+                )
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 422:
+                    raise
+                logger.info("Redmine rejected the text filter; filtering client-side only")
+                self._server_search = False
+
+        return self._make_request("GET", "/issues.json", params=params)
 
     def search_issues(
         self,
@@ -205,24 +362,60 @@ class RedmineClient(IssueTrackerClient):
         if project_id:
             params["project_id"] = project_id
 
-        # Note: Redmine doesn't have full-text search by default
-        # This searches by assigned_to=me as a common use case
         try:
-            data = self._make_request("GET", "/issues.json", params=params)
-            issues = []
-            for item in data.get("issues", []):
-                # Client-side filter by query if provided
-                if query:
-                    subject = item.get("subject", "").lower()
-                    desc = (item.get("description") or "").lower()
-                    if query.lower() not in subject and query.lower() not in desc:
-                        continue
-                issues.append(self._parse_issue(item))
-            return issues
+            data = self._fetch_issue_page(params, query)
+            # Client-side filter by query if provided
+            query_lower = query.lower()
+            return [
+                self._parse_issue(item)
+                for item in data.get("issues", [])
+                if not query or _matches_query(item, query_lower)
+            ]
         except Exception as e:
             logger.error(f"Search failed: {e}")
             return []
 
+    async def iter_issues(
+        self,
+        query: str,
+        page_size: int = 50,
+        project_id: str | None = None,
+    ) -> AsyncIterator[Issue]:
+        """
+        Stream open issues one page at a time.
+
+        Args:
+            query: Search query (matched against subject and description)
+            page_size: Issues fetched per request
+            project_id: Optional project filter
+
+        Yields:
+            Issue objects as each page arrives
+        """
+        logger.info(f"Streaming Redmine search: {query}")
+
+        params = {
+            "limit": page_size,
+            "offset": 0,
+            "status_id": "open",
+        }
+        if project_id:
+            params["project_id"] = project_id
+
+        query_lower = query.lower()
+        while True:
+            data = await asyncio.to_thread(self._fetch_issue_page, dict(params), query)
+            items = data.get("issues", [])
+            for item in items:
+                # Client-side filter by query if provided
+                if query and not _matches_query(item, query_lower):
+                    continue
+                yield self._parse_issue(item)
+
+            params["offset"] += len(items)
+            if not items or params["offset"] >= data.get("total_count", 0):
+                break
+
     def get_my_open_issues(self, project_key: str | None = None) -> list[Issue]:
         """
         Get open issues assigned to current user.
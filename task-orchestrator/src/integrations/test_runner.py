@@ -4,16 +4,83 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import re
+import shlex
 import subprocess
+import sys
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
 from src.config import ProjectConfig
+from src.utils.concurrency import gather_limited
 
 logger = logging.getLogger(__name__)
 
+# Failure patterns start at a word boundary and scan a bounded stretch of the
+# same line, so long log lines can't cause runaway backtracking. Test
+# identifiers are ASCII, so \w and \b skip the Unicode tables (re.ASCII)
+
+# Gradle: "3 tests completed, 1 failed" / "MyTest > testMethod FAILED"
+_GRADLE_SUMMARY_RE = re.compile(r"(\d+) tests? completed(?:, (\d+) failed)?(?:, (\d+) skipped)?")
+_GRADLE_FAILURE_RE = re.compile(r"\b(\w+) > (\w+)[^\n]{0,500}?FAILED", re.ASCII)
+
+# Maven Surefire: "Tests run: 5, Failures: 1, Errors: 0, Skipped: 0" /
+# "testMethod(com.example.MyTest)  Time elapsed: 0.1 s  <<< FAILURE!"
+_MAVEN_SUMMARY_RE = re.compile(r"Tests run: (\d+), Failures: (\d+), Errors: (\d+), Skipped: (\d+)")
+_MAVEN_FAILURE_RE = re.compile(
+    r"\b(\w+)\(([^)\n]{1,200})\)[^\n]{0,500}?<<<\s+(FAILURE|ERROR)", re.ASCII
+)
+
+# Jest: "Tests:       1 failed, 5 passed, 6 total" / "✕ should do something (5 ms)"
+_NPM_SUMMARY_RE = re.compile(
+    r"Tests:\s+(?:(\d+) failed,\s+)?(?:(\d+) skipped,\s+)?(\d+) passed,\s+(\d+) total"
+)
+_NPM_FAILURE_RE = re.compile(r"[✕×]\s+(.+?)\s+\(")
+
+# Test output is parsed as it streams in; only this many trailing lines are
+# kept on TestResult.output
+_OUTPUT_TAIL_LINES = 1000
+# Bytes read from the test process per call
+_READ_CHUNK_SIZE = 64 * 1024
+
+_IS_WINDOWS = sys.platform == "win32"
+
+
+def _find_failures(
+    pattern: re.Pattern[str],
+    output: str,
+    markers: tuple[str, ...],
+) -> Iterator[re.Match[str]]:
+    """
+    Match a failure pattern line by line, skipping lines without a marker.
+
+    Failure lines are a tiny share of a build log; a substring check rules
+    out the rest far more cheaply than starting the regex on every line.
+    """
+    for line in output.splitlines():
+        if any(marker in line for marker in markers):
+            yield from pattern.finditer(line)
+
+
+@lru_cache(maxsize=32)
+def _split_command(command: str) -> tuple[str, ...]:
+    """Split a configured test command, using the gradlew wrapper script on Windows."""
+    lexer = shlex.shlex(command, posix=True)
+    lexer.whitespace_split = True
+    if _IS_WINDOWS:
+        lexer.escape = ""  # Quotes are still removed, but backslashes are path separators
+    parts = list(lexer)
+    if _IS_WINDOWS and parts and parts[0] == "gradlew":
+        parts[0] = "gradlew.bat"
+    return tuple(parts)
+
 
 class ProjectType(Enum):
     """Project types based on build system."""
@@ -24,6 +91,14 @@ class ProjectType(Enum):
     UNKNOWN = auto()
 
 
+# Test command per project type, when none is configured
+_DEFAULT_TEST_COMMANDS: dict[ProjectType, tuple[str, ...]] = {
+    ProjectType.GRADLE: ("gradle", "test"),
+    ProjectType.MAVEN: ("mvn", "test"),
+    ProjectType.NPM: ("npm", "test"),
+}
+
+
 @dataclass
 class TestError:
     """Single test error details."""
@@ -55,11 +130,56 @@ class TestResult:
         return f"FAILED ({self.failed} failures, {self.passed} passed)"
 
 
+class _OutputCollector:
+    """Parses test output chunk by chunk, keeping only the last lines."""
+
+    def __init__(self, runner: TestRunner, project_type: ProjectType):
+        self._runner = runner
+        self._project_type = project_type
+        self._result = TestResult(success=False)
+        self._summary_found = False
+        self._tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        self._pending = b""  # Incomplete last line
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the complete lines in chunk; hold back a trailing partial line."""
+        data = self._pending + chunk
+        cut = data.rfind(b"\n") + 1
+        self._pending = data[cut:]
+        if cut:
+            # Cut at a newline, so no UTF-8 sequence is split
+            self._parse(data[:cut].decode("utf-8", errors="replace"))
+
+    def finish(self) -> TestResult:
+        """Parse any remaining partial line and return the result."""
+        if self._pending:
+            self._parse(self._pending.decode("utf-8", errors="replace"))
+            self._pending = b""
+        self._result.output = "\n".join(self._tail)
+        return self._result
+
+    def _parse(self, text: str) -> None:
+        part = self._runner._parse_test_output(text, self._project_type)
+        result = self._result
+        result.errors.extend(part.errors)
+
+        # Like a whole-output parse, the first summary wins
+        if not self._summary_found and (part.total_tests or part.failed or part.passed):
+            self._summary_found = True
+            result.total_tests = part.total_tests
+            result.passed = part.passed
+            result.failed = part.failed
+            result.skipped = part.skipped
+
+        self._tail.extend(text.splitlines())
+
+
 class TestRunner:
     """Runner for project tests with auto-detection."""
 
     def __init__(self, project_config: ProjectConfig | None = None):
         self._config = project_config
+        self._type_cache: dict[str, ProjectType] = {}  # project_path -> detected type
 
     def detect_project_type(self, project_path: str) -> ProjectType:
         """
@@ -71,18 +191,33 @@ class TestRunner:
         Returns:
             ProjectType enum value
         """
-        path = Path(project_path)
+        cached = self._type_cache.get(project_path)
+        if cached is not None:
+            return cached
+
+        project_type = self._detect_project_type(project_path)
+        self._type_cache[project_path] = project_type
+        return project_type
+
+    def _detect_project_type(self, project_path: str) -> ProjectType:
+        """Probe the build files in project_path."""
+        # List the directory once instead of stat-ing each build file
+        try:
+            with os.scandir(project_path) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            names = set()
 
         # Check for build files
-        if (path / "build.gradle").exists() or (path / "build.gradle.kts").exists():
+        if "build.gradle" in names or "build.gradle.kts" in names:
             logger.debug(f"Detected Gradle project: {project_path}")
             return ProjectType.GRADLE
 
-        if (path / "pom.xml").exists():
+        if "pom.xml" in names:
             logger.debug(f"Detected Maven project: {project_path}")
             return ProjectType.MAVEN
 
-        if (path / "package.json").exists():
+        if "package.json" in names:
             logger.debug(f"Detected NPM project: {project_path}")
             return ProjectType.NPM
 
@@ -93,28 +228,21 @@ class TestRunner:
         """Get test command for project."""
         # Use configured command if available
         if self._config and self._config.test_command:
-            cmd = self._config.test_command
-            # Handle gradlew on Windows
-            if cmd.startswith("gradlew"):
-                cmd = cmd.replace("gradlew", "gradlew.bat", 1)
-            return cmd.split()
+            return list(_split_command(self._config.test_command))
 
         # Auto-detect
         project_type = self.detect_project_type(project_path)
-        path = Path(project_path)
 
+        # Prefer the Gradle wrapper when the project ships one for this platform
         if project_type == ProjectType.GRADLE:
-            if (path / "gradlew.bat").exists():
-                return ["gradlew.bat", "test"]
-            return ["gradle", "test"]
-
-        if project_type == ProjectType.MAVEN:
-            return ["mvn", "test"]
+            wrapper = "gradlew.bat" if _IS_WINDOWS else "./gradlew"
+            if (Path(project_path) / wrapper).exists():
+                return [wrapper, "test"]
 
-        if project_type == ProjectType.NPM:
-            return ["npm", "test"]
-
-        raise ValueError(f"Cannot determine test command for {project_path}")
+        cmd = _DEFAULT_TEST_COMMANDS.get(project_type)
+        if cmd is None:
+            raise ValueError(f"Cannot determine test command for {project_path}")
+        return list(cmd)
 
     async def run_tests(self, project_path: str) -> TestResult:
         """
@@ -142,18 +270,15 @@ class TestRunner:
                 env=None,  # Use parent environment
             )
 
-            stdout, _ = await process.communicate()
-            output = stdout.decode("utf-8", errors="replace")
-
-            duration = time.time() - start_time
-            success = process.returncode == 0
+            # Parse results based on project type as the output arrives
+            collector = _OutputCollector(self, self.detect_project_type(project_path))
+            while chunk := await process.stdout.read(_READ_CHUNK_SIZE):
+                collector.feed(chunk)
+            await process.wait()
 
-            # Parse results based on project type
-            project_type = self.detect_project_type(project_path)
-            result = self._parse_test_output(output, project_type)
-            result.success = success
-            result.output = output
-            result.duration_seconds = duration
+            result = collector.finish()
+            result.success = process.returncode == 0
+            result.duration_seconds = time.time() - start_time
 
             logger.info(f"Tests completed: {result.summary}")
             return result
@@ -184,23 +309,36 @@ class TestRunner:
         start_time = time.time()
 
         try:
-            result = subprocess.run(
+            collector = _OutputCollector(self, self.detect_project_type(project_path))
+
+            with subprocess.Popen(
                 cmd,
                 cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=600,  # 10 minute timeout
-            )
-
-            output = result.stdout + result.stderr
-            duration = time.time() - start_time
-            success = result.returncode == 0
-
-            project_type = self.detect_project_type(project_path)
-            test_result = self._parse_test_output(output, project_type)
-            test_result.success = success
-            test_result.output = output
-            test_result.duration_seconds = duration
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            ) as process:
+                # 10 minute timeout: killing the process ends the read loop
+                timed_out = threading.Event()
+
+                def kill() -> None:
+                    timed_out.set()
+                    process.kill()
+
+                timer = threading.Timer(600, kill)
+                timer.start()
+                try:
+                    while chunk := process.stdout.read1(_READ_CHUNK_SIZE):
+                        collector.feed(chunk)
+                    process.wait()
+                finally:
+                    timer.cancel()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, 600)
+
+            test_result = collector.finish()
+            test_result.success = process.returncode == 0
+            test_result.duration_seconds = time.time() - start_time
 
             logger.info(f"Tests completed: {test_result.summary}")
             return test_result
@@ -218,25 +356,79 @@ class TestRunner:
                 duration_seconds=time.time() - start_time,
             )
 
+    async def run_tests_many(
+        self,
+        project_paths: list[str],
+        concurrency: int | None = None,
+    ) -> list[TestResult]:
+        """
+        Run the tests of several projects concurrently.
+
+        Args:
+            project_paths: Paths to project directories
+            concurrency: Maximum number of test runs at once (defaults to the
+                CPU count)
+
+        Returns:
+            TestResults in the same order as project_paths
+        """
+        return await gather_limited(
+            self.run_tests, project_paths, concurrency or os.cpu_count() or 4
+        )
+
+    def run_tests_batch_sync(
+        self,
+        project_paths: list[str],
+        max_workers: int | None = None,
+    ) -> list[TestResult]:
+        """
+        Run the tests of several projects in parallel, without an event loop.
+
+        The work happens in the test subprocesses, so a worker thread per run
+        (not a process) is enough to wait on them.
+
+        Args:
+            project_paths: Paths to project directories
+            max_workers: Maximum number of test runs at once (defaults to the
+                CPU count)
+
+        Returns:
+            TestResults in the same order as project_paths
+        """
+        return asyncio.run(
+            gather_limited(
+                self.run_tests_sync_async, project_paths, max_workers or os.cpu_count() or 4
+            )
+        )
+
+    async def run_tests_sync_async(self, project_path: str) -> TestResult:
+        """
+        Run run_tests_sync in a worker thread.
+
+        Use this instead of run_tests_sync from async code; the (up to 10
+        minute) test run blocks a thread rather than the event loop.
+
+        Args:
+            project_path: Path to project directory
+
+        Returns:
+            TestResult with execution details
+        """
+        return await asyncio.to_thread(self.run_tests_sync, project_path)
+
     def _parse_test_output(self, output: str, project_type: ProjectType) -> TestResult:
         """Parse test output to extract results."""
-        if project_type == ProjectType.GRADLE:
-            return self._parse_gradle_output(output)
-        elif project_type == ProjectType.MAVEN:
-            return self._parse_maven_output(output)
-        elif project_type == ProjectType.NPM:
-            return self._parse_npm_output(output)
-        else:
+        parser = self._PARSERS.get(project_type)
+        if parser is None:
             return TestResult(success=False, output=output)
+        return parser(self, output)
 
     def _parse_gradle_output(self, output: str) -> TestResult:
         """Parse Gradle test output."""
         result = TestResult(success=True)
 
         # Look for test summary
-        # Example: "3 tests completed, 1 failed"
-        summary_pattern = r"(\d+) tests? completed(?:, (\d+) failed)?(?:, (\d+) skipped)?"
-        match = re.search(summary_pattern, output)
+        match = _GRADLE_SUMMARY_RE.search(output)
 
         if match:
             result.total_tests = int(match.group(1))
@@ -245,9 +437,7 @@ class TestRunner:
             result.passed = result.total_tests - result.failed - result.skipped
 
         # Parse individual failures
-        # Example: "MyTest > testMethod FAILED"
-        failure_pattern = r"(\w+) > (\w+).*FAILED"
-        for match in re.finditer(failure_pattern, output):
+        for match in _find_failures(_GRADLE_FAILURE_RE, output, ("FAILED",)):
             result.errors.append(
                 TestError(
                     test_class=match.group(1),
@@ -263,9 +453,7 @@ class TestRunner:
         result = TestResult(success=True)
 
         # Look for Surefire summary
-        # Example: "Tests run: 5, Failures: 1, Errors: 0, Skipped: 0"
-        summary_pattern = r"Tests run: (\d+), Failures: (\d+), Errors: (\d+), Skipped: (\d+)"
-        match = re.search(summary_pattern, output)
+        match = _MAVEN_SUMMARY_RE.search(output)
 
         if match:
             result.total_tests = int(match.group(1))
@@ -274,9 +462,7 @@ class TestRunner:
             result.passed = result.total_tests - result.failed - result.skipped
 
         # Parse failures
-        # Example: "testMethod(com.example.MyTest)  Time elapsed: 0.1 s  <<< FAILURE!"
-        failure_pattern = r"(\w+)\(([^)]+)\).*<<<\s+(FAILURE|ERROR)"
-        for match in re.finditer(failure_pattern, output):
+        for match in _find_failures(_MAVEN_FAILURE_RE, output, ("<<<",)):
             result.errors.append(
                 TestError(
                     test_name=match.group(1),
@@ -292,9 +478,7 @@ class TestRunner:
         result = TestResult(success=True)
 
         # Jest summary
-        # Example: "Tests:       1 failed, 5 passed, 6 total"
-        summary_pattern = r"Tests:\s+(?:(\d+) failed,\s+)?(?:(\d+) skipped,\s+)?(\d+) passed,\s+(\d+) total"
-        match = re.search(summary_pattern, output)
+        match = _NPM_SUMMARY_RE.search(output)
 
         if match:
             result.failed = int(match.group(1)) if match.group(1) else 0
@@ -303,9 +487,7 @@ class TestRunner:
             result.total_tests = int(match.group(4))
 
         # Parse failed test names
-        # Example: "✕ should do something (5 ms)"
-        failure_pattern = r"[✕×]\s+(.+?)\s+\("
-        for match in re.finditer(failure_pattern, output):
+        for match in _find_failures(_NPM_FAILURE_RE, output, ("✕", "×")):
             result.errors.append(
                 TestError(
                     test_name=match.group(1),
@@ -316,6 +498,13 @@ class TestRunner:
 
         return result
 
+    # Output parser per project type
+    _PARSERS: dict[ProjectType, Callable[[TestRunner, str], TestResult]] = {
+        ProjectType.GRADLE: _parse_gradle_output,
+        ProjectType.MAVEN: _parse_maven_output,
+        ProjectType.NPM: _parse_npm_output,
+    }
+
     def get_error_summary(self, result: TestResult, max_lines: int = 50) -> str:
         """
         Get a summary of errors for Claude to fix.
@@ -327,22 +516,28 @@ class TestRunner:
         Returns:
             Error summary string
         """
-        parts = [f"Test Result: {result.summary}", ""]
-
+        failures: list[str] = []
         if result.errors:
-            parts.append("Failed Tests:")
-            for error in result.errors:
-                parts.append(f"  - {error.test_class}.{error.test_name}: {error.message}")
-            parts.append("")
+            failures.append("Failed Tests:")
+            failures.extend(
+                f"  - {error.test_class}.{error.test_name}: {error.message}"
+                for error in result.errors
+            )
+            failures.append("")
 
         # Include relevant output (last N lines)
+        output_title: tuple[str, ...] = ()
+        lines: list[str] = []
         if result.output:
-            lines = result.output.strip().split("\n")
+            # Split off at most the last max_lines lines (plus the unsplit rest)
+            lines = result.output.strip().rsplit("\n", max_lines)
             if len(lines) > max_lines:
-                lines = lines[-max_lines:]
-                parts.append(f"Output (last {max_lines} lines):")
+                del lines[0]
+                output_title = (f"Output (last {max_lines} lines):",)
             else:
-                parts.append("Full Output:")
-            parts.extend(lines)
+                output_title = ("Full Output:",)
 
-        return "\n".join(parts)
+        # Join the sections directly rather than copying them into one list
+        return "\n".join(
+            chain((f"Test Result: {result.summary}", ""), failures, output_title, lines)
+        )
@@ -6,17 +6,11 @@ import argparse
 import asyncio
 import sys
 from pathlib import Path
-
-from rich.console import Console
+from typing import Callable
 
 from src.config import get_settings, clear_settings_cache
 from src.config.settings import TrackerType
-from src.utils.logger import setup_logging, print_banner
-from src.ui import TaskOrchestratorApp
-from src.core import Orchestrator
-
-
-console = Console()
+from src.utils.logger import get_console, setup_logging, print_banner
 
 
 def parse_args() -> argparse.Namespace:
@@ -54,6 +48,16 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+async def _probe_all(probes: list[Callable[[], bool]]) -> list[bool]:
+    """Run blocking connection probes concurrently in worker threads."""
+    results = await asyncio.gather(
+        *(asyncio.to_thread(probe) for probe in probes),
+        return_exceptions=True,
+    )
+    # A probe that raised counts as failed
+    return [result is True for result in results]
+
+
 def check_connections(settings) -> bool:
     """Check all service connections."""
     from src.integrations import (
@@ -64,14 +68,33 @@ def check_connections(settings) -> bool:
         create_tracker_client,
     )
 
+    console = get_console()
     console.print("\n[bold]Checking connections...[/bold]\n")
     console.print(f"Active tracker: [cyan]{settings.tracker.value}[/cyan]\n")
     all_ok = True
 
+    claude = ClaudeCLI(settings)
+    tracker = create_tracker_client(settings)
+    bitbucket = BitbucketClient(settings)
+
+    # Optionally check the other tracker if configured
+    backup_name = None
+    backup = None
+    if settings.tracker == TrackerType.JIRA and settings.redmine.api_key:
+        backup_name, backup = "Redmine", RedmineClient(settings)
+    elif settings.tracker == TrackerType.REDMINE and settings.jira.api_token:
+        backup_name, backup = "Jira", JiraClient(settings)
+
+    # Each probe is a network round-trip (or CLI launch); run them all at
+    # once and report in the usual order
+    probes = [claude.test_cli_available, tracker.test_connection, bitbucket.test_connection]
+    if backup is not None:
+        probes.append(backup.test_connection)
+    claude_ok, tracker_ok, bitbucket_ok, *backup_ok = asyncio.run(_probe_all(probes))
+
     # Check Claude CLI
     console.print("Claude CLI: ", end="")
-    claude = ClaudeCLI(settings)
-    if claude.test_cli_available():
+    if claude_ok:
         console.print("[green]OK[/green]")
     else:
         console.print("[red]NOT FOUND[/red]")
@@ -81,34 +104,23 @@ def check_connections(settings) -> bool:
     # Check active tracker (Jira or Redmine)
     tracker_name = settings.tracker.value.capitalize()
     console.print(f"{tracker_name}: ", end="")
-    tracker = create_tracker_client(settings)
-    if tracker.test_connection():
+    if tracker_ok:
         console.print("[green]OK[/green]")
     else:
         console.print("[red]FAILED[/red]")
         console.print(f"  Check your {tracker_name} credentials in config")
         all_ok = False
 
-    # Optionally check the other tracker if configured
-    if settings.tracker == TrackerType.JIRA and settings.redmine.api_key:
-        console.print("Redmine (backup): ", end="")
-        redmine = RedmineClient(settings)
-        if redmine.test_connection():
-            console.print("[green]OK[/green]")
-        else:
-            console.print("[yellow]NOT CONFIGURED[/yellow]")
-    elif settings.tracker == TrackerType.REDMINE and settings.jira.api_token:
-        console.print("Jira (backup): ", end="")
-        jira = JiraClient(settings)
-        if jira.test_connection():
+    if backup is not None:
+        console.print(f"{backup_name} (backup): ", end="")
+        if backup_ok[0]:
             console.print("[green]OK[/green]")
         else:
             console.print("[yellow]NOT CONFIGURED[/yellow]")
 
     # Check Bitbucket
     console.print("Bitbucket: ", end="")
-    bitbucket = BitbucketClient(settings)
-    if bitbucket.test_connection():
+    if bitbucket_ok:
         console.print("[green]OK[/green]")
     else:
         console.print("[red]FAILED[/red]")
@@ -121,6 +133,9 @@ def check_connections(settings) -> bool:
 
 async def run_single_task(issue_key: str, settings) -> int:
     """Run a single task without TUI."""
+    from src.core import Orchestrator
+
+    console = get_console()
     tracker_name = settings.tracker.value.capitalize()
     console.print(f"\n[bold]Running task: {issue_key}[/bold]")
     console.print(f"Tracker: [cyan]{tracker_name}[/cyan]\n")
@@ -130,7 +145,10 @@ async def run_single_task(issue_key: str, settings) -> int:
         on_log=lambda key, msg: console.print(f"[dim]{key}[/dim] {msg}"),
     )
 
-    result = await orchestrator.run_single(issue_key)
+    try:
+        result = await orchestrator.run_single(issue_key)
+    finally:
+        await orchestrator.stop()
 
     if result.success:
         console.print(f"\n[green]Task completed successfully![/green]")
@@ -158,16 +176,20 @@ def main() -> int:
 
     # Check connections mode
     if args.check:
-        print_banner()
+        if sys.stdout.isatty():
+            print_banner()
         success = check_connections(settings)
         return 0 if success else 1
 
     # Single task mode
     if args.run:
-        print_banner()
+        if sys.stdout.isatty():
+            print_banner()
         return asyncio.run(run_single_task(args.run, settings))
 
-    # TUI mode
+    # TUI mode (Textual is only imported when it is needed)
+    from src.ui import TaskOrchestratorApp
+
     app = TaskOrchestratorApp(settings)
     app.run()
     return 0
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+import time
+from collections import deque
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -23,6 +24,23 @@ from textual.widgets import (
 from src.config import Settings, get_settings
 from src.core import Orchestrator, TaskState
 
+# Seconds between applying queued task updates and log lines to the UI
+_FLUSH_INTERVAL = 0.1
+
+# Label style class per task state name
+_STATUS_STYLES = {
+    "PENDING": "status-pending",
+    "FETCHING": "status-active",
+    "IMPLEMENTING": "status-active",
+    "TESTING": "status-active",
+    "FIXING": "status-active",
+    "CREATING_PR": "status-active",
+    "UPDATING_JIRA": "status-active",
+    "COMPLETED": "status-completed",
+    "FAILED": "status-failed",
+    "MANUAL_REVIEW": "status-review",
+}
+
 
 class TaskListItem(ListItem):
     """Custom list item for tasks."""
@@ -31,31 +49,21 @@ class TaskListItem(ListItem):
         super().__init__()
         self.jira_key = jira_key
         self.status = status
+        self._label: Label | None = None  # Set by compose
 
     def compose(self) -> ComposeResult:
-        status_style = self._get_status_style()
-        yield Label(f"{self.jira_key} [{self.status}]", classes=status_style)
+        self._label = Label(f"{self.jira_key} [{self.status}]", classes=self._get_status_style())
+        yield self._label
 
     def _get_status_style(self) -> str:
-        status_map = {
-            "PENDING": "status-pending",
-            "FETCHING": "status-active",
-            "IMPLEMENTING": "status-active",
-            "TESTING": "status-active",
-            "FIXING": "status-active",
-            "CREATING_PR": "status-active",
-            "UPDATING_JIRA": "status-active",
-            "COMPLETED": "status-completed",
-            "FAILED": "status-failed",
-            "MANUAL_REVIEW": "status-review",
-        }
-        return status_map.get(self.status, "")
+        return _STATUS_STYLES.get(self.status, "")
 
     def update_status(self, status: str) -> None:
         self.status = status
-        label = self.query_one(Label)
-        label.update(f"{self.jira_key} [{status}]")
-        label.classes = self._get_status_style()
+        # Before compose, the label is simply created with the new status
+        if self._label is not None:
+            self._label.update(f"{self.jira_key} [{status}]")
+            self._label.classes = self._get_status_style()
 
 
 class TaskQueueWidget(Static):
@@ -70,11 +78,17 @@ class CurrentTaskWidget(Static):
     """Widget displaying current task details."""
 
     def compose(self) -> ComposeResult:
+        # Keep the labels so updates don't have to query for them
+        self._key_label = Label("No active task", id="current-task-key")
+        self._status_label = Label("Status: -", id="current-task-status")
+        self._project_label = Label("Project: -", id="current-task-project")
+        self._attempt_label = Label("Attempt: -", id="current-task-attempt")
+
         yield Label("Current Task", classes="widget-title")
-        yield Label("No active task", id="current-task-key")
-        yield Label("Status: -", id="current-task-status")
-        yield Label("Project: -", id="current-task-project")
-        yield Label("Attempt: -", id="current-task-attempt")
+        yield self._key_label
+        yield self._status_label
+        yield self._project_label
+        yield self._attempt_label
 
     def update_task(
         self,
@@ -83,25 +97,35 @@ class CurrentTaskWidget(Static):
         project: str = "-",
         attempt: str = "-",
     ) -> None:
-        self.query_one("#current-task-key", Label).update(
-            jira_key if jira_key else "No active task"
-        )
-        self.query_one("#current-task-status", Label).update(f"Status: {status}")
-        self.query_one("#current-task-project", Label).update(f"Project: {project}")
-        self.query_one("#current-task-attempt", Label).update(f"Attempt: {attempt}")
+        self._key_label.update(jira_key if jira_key else "No active task")
+        self._status_label.update(f"Status: {status}")
+        self._project_label.update(f"Project: {project}")
+        self._attempt_label.update(f"Attempt: {attempt}")
 
 
 class LogWidget(Static):
     """Widget for live log output."""
 
+    # Formatted clock, reformatted only when the second changes
+    _timestamp_second = -1
+    _timestamp = ""
+
     def compose(self) -> ComposeResult:
+        self._output = RichLog(id="log-output", highlight=True, markup=True)
         yield Label("Live Output", classes="widget-title")
-        yield RichLog(id="log-output", highlight=True, markup=True)
+        yield self._output
 
     def write_log(self, message: str) -> None:
-        log = self.query_one("#log-output", RichLog)
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log.write(f"[dim]{timestamp}[/dim] {message}")
+        self.write_logs([message])
+
+    def write_logs(self, messages: list[str]) -> None:
+        """Write several messages with a single RichLog update."""
+        second = int(time.time())
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+        timestamp = self._timestamp
+        self._output.write("\n".join(f"[dim]{timestamp}[/dim] {message}" for message in messages))
 
 
 class AddTaskModal(Static):
@@ -209,6 +233,11 @@ class TaskOrchestratorApp(App):
         self._orchestrator: Orchestrator | None = None
         self._task_items: dict[str, TaskListItem] = {}
 
+        # Task updates and log lines queued by the runner, applied in batches
+        # by _flush_updates (deque appends/pops are thread-safe)
+        self._pending_states: deque[tuple[str, TaskState]] = deque()
+        self._pending_logs: deque[str] = deque()
+
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         yield TaskQueueWidget()
@@ -232,6 +261,10 @@ class TaskOrchestratorApp(App):
         # Start orchestrator in background
         asyncio.create_task(self._orchestrator.start())
 
+        # Apply queued task updates and log lines a few times per second
+        # instead of re-rendering on every event
+        self.set_interval(_FLUSH_INTERVAL, self._flush_updates)
+
         self._log("Orchestrator started. Press 'a' to add a task.")
 
     def _log(self, message: str) -> None:
@@ -243,8 +276,8 @@ class TaskOrchestratorApp(App):
             pass
 
     def _on_task_update(self, jira_key: str, state: TaskState) -> None:
-        """Handle task state updates."""
-        self.call_from_thread(self._update_task_state, jira_key, state)
+        """Handle task state updates (queued for the next flush)."""
+        self._pending_states.append((jira_key, state))
 
     def _update_task_state(self, jira_key: str, state: TaskState) -> None:
         """Update task state in UI."""
@@ -257,8 +290,28 @@ class TaskOrchestratorApp(App):
             current.update_task(jira_key, status=state.name)
 
     def _on_log(self, jira_key: str, message: str) -> None:
-        """Handle log messages from task runner."""
-        self.call_from_thread(self._log, f"[{jira_key}] {message}")
+        """Handle log messages from task runner (queued for the next flush)."""
+        self._pending_logs.append(f"[{jira_key}] {message}")
+
+    def _flush_updates(self) -> None:
+        """Apply queued task updates and log lines."""
+        # Only the latest state of each task needs rendering
+        states: dict[str, TaskState] = {}
+        while self._pending_states:
+            jira_key, state = self._pending_states.popleft()
+            states.pop(jira_key, None)  # Re-insert so the latest update applies last
+            states[jira_key] = state
+        for jira_key, state in states.items():
+            self._update_task_state(jira_key, state)
+
+        messages = []
+        while self._pending_logs:
+            messages.append(self._pending_logs.popleft())
+        if messages:
+            try:
+                self.query_one(LogWidget).write_logs(messages)
+            except Exception:
+                pass
 
     def action_add_task(self) -> None:
         """Show add task modal."""
@@ -1,5 +1,6 @@
 """Utility modules."""
 
+from .concurrency import gather_limited
 from .logger import get_logger, setup_logging
 
-__all__ = ["get_logger", "setup_logging"]
+__all__ = ["gather_limited", "get_logger", "setup_logging"]
@@ -0,0 +1,35 @@
+"""Helpers for bounded asyncio fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def gather_limited(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int,
+) -> list[R]:
+    """
+    Await func(item) for every item, with at most limit calls in flight.
+
+    Args:
+        func: Coroutine function applied to each item
+        items: Inputs to fan out over
+        limit: Maximum number of concurrent calls (at least 1)
+
+    Returns:
+        Results in the same order as items
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run_limited(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*(run_limited(item) for item in items)))
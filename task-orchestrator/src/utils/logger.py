@@ -2,47 +2,174 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+from collections.abc import MutableMapping
 from datetime import datetime
+from functools import cache
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import os
 
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.theme import Theme
+# Rich is only imported once console output actually goes through it
+# (an interactive terminal, or the banner)
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Custom theme styles for logging
+CUSTOM_THEME = {
+    "info": "cyan",
+    "warning": "yellow",
+    "error": "bold red",
+    "success": "bold green",
+    "task": "bold magenta",
+    "state": "bold blue",
+}
+
+# Global console instance (see get_console)
+console: Console | None = None
+
+# Windows console API values (GetStdHandle / SetConsoleMode)
+_STD_OUTPUT_HANDLE = -11
+_STD_ERROR_HANDLE = -12
+_ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
+# Timestamp format of plain console lines and the log file
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Format fields missing from records not logged through a TaskLogger
+_FORMAT_DEFAULTS = {"task_prefix": ""}
+
+# Log records buffered before they are written to the log file
+_FILE_BUFFER_RECORDS = 1024
+# Write buffer size of the log file
+_FILE_BUFFER_BYTES = 64 * 1024
+# Log files roll over at this size, keeping this many old files
+_LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+_LOG_FILE_BACKUPS = 10
+
+# task key -> logger adapter, so repeat TaskLoggers skip logging's manager lock
+# (task loggers live as long as the process anyway)
+_task_adapters: dict[str, logging.LoggerAdapter] = {}
+
+# Background thread writing queued records to the handlers (see setup_logging)
+_listener: QueueListener | None = None
+
+
+def get_console() -> Console:
+    """Get or create the shared Rich console."""
+    global console
+    if console is None:
+        from rich.console import Console
+        from rich.theme import Theme
+
+        console = Console(theme=Theme(CUSTOM_THEME), force_terminal=True)
+    return console
+
+
+@cache
+def _init_windows_console() -> None:
+    """Enable ANSI escape sequences and force UTF-8 output on Windows (once)."""
+    if sys.platform != "win32":
+        return
+
+    import ctypes
+
+    # Turn on VT processing for stdout/stderr directly, instead of spawning
+    # a shell (os.system("")) for its side effect
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    for std_handle in (_STD_OUTPUT_HANDLE, _STD_ERROR_HANDLE):
+        handle = kernel32.GetStdHandle(std_handle)
+        mode = ctypes.c_ulong()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | _ENABLE_VIRTUAL_TERMINAL_PROCESSING)
 
-# Force UTF-8 on Windows
-if sys.platform == "win32":
-    os.system("")  # Enable ANSI escape sequences on Windows
     sys.stdout.reconfigure(encoding="utf-8", errors="replace")  # type: ignore
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")  # type: ignore
 
-# Custom theme for logging
-CUSTOM_THEME = Theme(
-    {
-        "info": "cyan",
-        "warning": "yellow",
-        "error": "bold red",
-        "success": "bold green",
-        "task": "bold magenta",
-        "state": "bold blue",
-    }
-)
 
-# Global console instance
-console = Console(theme=CUSTOM_THEME, force_terminal=True)
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter reusing the formatted asctime for records in the same second."""
 
+    _cached_second = -1
+    _cached_time = ""
 
-class TaskFormatter(logging.Formatter):
-    """Custom formatter for task-related logs."""
+    def formatTime(  # noqa: N802
+        self, record: logging.LogRecord, datefmt: str | None = None
+    ) -> str:
+        # Only valid for second-resolution date formats
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
 
-    def format(self, record: logging.LogRecord) -> str:
-        # Add task key if available
-        if hasattr(record, "task_key"):
-            record.msg = f"[{record.task_key}] {record.msg}"
-        return super().format(record)
+
+class _BufferedFileHandler(RotatingFileHandler):
+    """Size-rotated log file written through a block buffer instead of flushed per record."""
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            encoding=self.encoding,
+            errors=self.errors,
+            buffering=_FILE_BUFFER_BYTES,
+        )
+        # File size is tracked here, since tell() would flush the buffer
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Same as RotatingFileHandler.emit, minus the flush after every
+        # record; the buffer is written when full, on ERROR records and on
+        # flush()/close()
+        if self.stream is None and (self.mode != "w" or not self._closed):
+            self.stream = self._open()
+        if self.stream is None:
+            return
+
+        try:
+            msg = self.format(record) + self.terminator
+            # Character count, close enough to bytes for log text
+            if self.maxBytes > 0 and self._size and self._size + len(msg) > self.maxBytes:
+                self.doRollover()
+            self.stream.write(msg)
+            self._size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+
+        if record.levelno >= logging.ERROR:
+            self.flush()
+
+
+class _LocalQueueHandler(QueueHandler):
+    """QueueHandler for an in-process queue that keeps exception info."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments now (they may change before the listener runs),
+        # but keep exc_info so the console still renders rich tracebacks
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _stop_listener() -> None:
+    """Drain queued records before logging.shutdown() closes the handlers."""
+    if _listener is not None:
+        _listener.stop()
+
+
+# Registered after logging's own exit hook, so it runs before it
+atexit.register(_stop_listener)
 
 
 def setup_logging(
@@ -58,6 +185,15 @@ def setup_logging(
         level: Logging level
         log_to_file: Whether to also log to file
     """
+    _init_windows_console()
+
+    # No handler format uses process/thread/task details; skip collecting
+    # them for every record
+    logging.logProcesses = False
+    logging.logThreads = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False  # Python 3.12+
+
     # Create log directory
     log_path = Path(log_dir)
     log_path.mkdir(parents=True, exist_ok=True)
@@ -66,34 +202,86 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # Clear existing handlers
+    # Clear existing handlers; the previous setup's listener drains its queue
+    # and its handlers write out what they buffered
     root_logger.handlers.clear()
-
-    # Rich console handler
-    rich_handler = RichHandler(
-        console=console,
-        show_time=True,
-        show_path=False,
-        rich_tracebacks=True,
-        tracebacks_show_locals=True,
-        markup=True,
-    )
-    rich_handler.setFormatter(TaskFormatter("%(message)s"))
-    root_logger.addHandler(rich_handler)
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            target = getattr(handler, "target", None)
+            handler.close()  # A MemoryHandler flushes into its target first
+            if target is not None:
+                target.close()
+        _listener = None
+
+    # Console handler: Rich on an interactive terminal; plain lines when
+    # output is piped or redirected (no markup parsing or ANSI encoding)
+    if sys.stdout.isatty() and "NO_COLOR" not in os.environ:
+        # Capturing locals walks every frame of a traceback, so only do it
+        # when debugging or when asked for (ORCHESTRATOR_TB_LOCALS=1)
+        show_locals = level <= logging.DEBUG or os.environ.get("ORCHESTRATOR_TB_LOCALS") == "1"
+        from rich.logging import RichHandler
+
+        console_handler: logging.Handler = RichHandler(
+            console=get_console(),
+            show_time=True,
+            omit_repeated_times=True,
+            log_time_format="%H:%M:%S",
+            show_path=False,
+            rich_tracebacks=True,
+            tracebacks_show_locals=show_locals,
+            tracebacks_word_wrap=False,
+            markup=True,
+        )
+        console_handler.setFormatter(
+            logging.Formatter("%(task_prefix)s%(message)s", defaults=_FORMAT_DEFAULTS)
+        )
+    else:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(
+            _SecondCachedFormatter(
+                "%(asctime)s | %(levelname)-8s | %(task_prefix)s%(message)s",
+                datefmt=_DATE_FORMAT,
+                defaults=_FORMAT_DEFAULTS,
+            )
+        )
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handler
     if log_to_file:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_path / f"orchestrator_{timestamp}.log"
 
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = _BufferedFileHandler(
+            log_file,
+            maxBytes=_LOG_FILE_MAX_BYTES,
+            backupCount=_LOG_FILE_BACKUPS,
+            encoding="utf-8",
+        )
         file_handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
+            _SecondCachedFormatter(
+                "%(asctime)s | %(levelname)-8s | %(name)s | %(task_prefix)s%(message)s",
+                datefmt=_DATE_FORMAT,
+                defaults=_FORMAT_DEFAULTS,
             )
         )
-        root_logger.addHandler(file_handler)
+        # Buffer file records and write them in batches; ERROR and above
+        # flush immediately, and logging.shutdown() flushes the rest at exit
+        memory_handler = MemoryHandler(
+            _FILE_BUFFER_RECORDS,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        handlers.append(memory_handler)
+
+    # Callers only enqueue records; a listener thread formats them and does
+    # the console and file I/O
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger.addHandler(_LocalQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     # Reduce noise from third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -106,29 +294,52 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+class _TaskAdapter(logging.LoggerAdapter):
+    """LoggerAdapter that merges per-call ``extra`` over the task context."""
+
+    def process(
+        self, msg: Any, kwargs: MutableMapping[str, Any]
+    ) -> tuple[Any, MutableMapping[str, Any]]:
+        # The stock adapter replaces the caller's extra outright (before 3.13)
+        kwargs["extra"] = {**self.extra, **(kwargs.get("extra") or {})}
+        return msg, kwargs
+
+
+def _task_adapter(task_key: str) -> logging.LoggerAdapter:
+    """Get the (cached) logger adapter for a task."""
+    adapter = _task_adapters.get(task_key)
+    if adapter is None:
+        # Every record carries the task key and its "[KEY] " message prefix
+        # (used by the handler formats)
+        adapter = _TaskAdapter(
+            logging.getLogger(f"task.{task_key}"),
+            {"task_key": task_key, "task_prefix": f"[{task_key}] "},
+        )
+        # Racing threads build equivalent adapters; keep whichever lands first
+        adapter = _task_adapters.setdefault(task_key, adapter)
+    return adapter
+
+
 class TaskLogger:
     """Logger wrapper for task-specific logging."""
 
+    __slots__ = ("task_key", "_logger")
+
     def __init__(self, task_key: str):
         self.task_key = task_key
-        self._logger = logging.getLogger(f"task.{task_key}")
-
-    def _log(self, level: int, msg: str, *args, **kwargs) -> None:
-        extra = kwargs.pop("extra", {})
-        extra["task_key"] = self.task_key
-        self._logger.log(level, msg, *args, extra=extra, **kwargs)
+        self._logger = _task_adapter(task_key)
 
     def info(self, msg: str, *args, **kwargs) -> None:
-        self._log(logging.INFO, msg, *args, **kwargs)
+        self._logger.info(msg, *args, **kwargs)
 
     def warning(self, msg: str, *args, **kwargs) -> None:
-        self._log(logging.WARNING, msg, *args, **kwargs)
+        self._logger.warning(msg, *args, **kwargs)
 
     def error(self, msg: str, *args, **kwargs) -> None:
-        self._log(logging.ERROR, msg, *args, **kwargs)
+        self._logger.error(msg, *args, **kwargs)
 
     def debug(self, msg: str, *args, **kwargs) -> None:
-        self._log(logging.DEBUG, msg, *args, **kwargs)
+        self._logger.debug(msg, *args, **kwargs)
 
     def state_change(self, from_state: str, to_state: str) -> None:
         """Log a state transition."""
@@ -154,4 +365,4 @@ def print_banner() -> None:
 |         Automate Jira/Redmine Tasks with Claude CLI          |
 +==============================================================+
 """
-    console.print(banner, style="bold cyan")
+    get_console().print(banner, style="bold cyan")